@@ -0,0 +1,193 @@
+"""Append-only binary archive of parsed forecasts and observations."""
+import threading
+import time
+from os import makedirs, path, replace
+
+import numpy as np
+
+# KIND OF RECORD
+OBSERVATION = 0
+FORECAST = 1
+
+# LONGEST TIME A FORECAST IS FETCHED AHEAD OF WHAT IT IS VALID FOR (s)
+FORECAST_HORIZON = 5 * 86400
+
+# ONE FIXED SIZE RECORD PER WEATHER SAMPLE
+RECORD_DTYPE = np.dtype(
+    [
+        ("issued", "<i8"),  # unix time the sample was fetched
+        ("valid", "<i8"),  # unix time the sample is valid for
+        ("kind", "u1"),
+        ("temp", "<f4"),
+        ("humidity", "<f4"),
+        ("icon", "S3"),
+    ],
+)
+
+
+class ForecastArchive:
+    """Store every fetched sample of one location in a memory-mapped file.
+
+    Records are only ever appended and ``issued`` never decreases, so a
+    time range is found with a binary search and returned as a view of
+    the mapped file without copying.
+    """
+
+    __lock = threading.Lock()
+    __pruned: set = set()
+
+    def __init__(
+        self,
+        directory: str,
+        latitude: float,
+        longitude: float,
+        retention_days=None,
+    ):
+        """Initialize class ForecastArchive.
+
+        With retention_days, records fetched before that many days ago are
+        dropped the first time a process opens the file.
+        """
+        makedirs(directory, exist_ok=True)
+        self.file_path = path.join(
+            directory,
+            f"{latitude:.2f}_{longitude:.2f}.bin",
+        )
+        if retention_days is not None and self.file_path not in self.__pruned:
+            self.__pruned.add(self.file_path)
+            self.prune(int(time.time() - retention_days * 86400))
+
+    def append_observation(self, valid: int, temp: float, humidity, icon: str):
+        """Append the current weather of the location."""
+        self.append([(valid, OBSERVATION, temp, humidity, icon)])
+
+    def append_forecast(self, samples: list):
+        """Append forecast samples given as (valid, temp, humidity, icon)."""
+        self.append(
+            [
+                (valid, FORECAST, temp, humidity, icon)
+                for valid, temp, humidity, icon in samples
+            ],
+        )
+
+    def append(self, samples: list):
+        """Append (valid, kind, temp, humidity, icon) samples."""
+        if not samples:
+            return
+        records = np.zeros(len(samples), dtype=RECORD_DTYPE)
+        with self.__lock:
+            issued = max(int(time.time()), self.__last_issued())
+            for num, (valid, kind, temp, humidity, icon) in enumerate(samples):
+                records[num] = (
+                    issued,
+                    valid,
+                    kind,
+                    temp,
+                    humidity,
+                    icon.encode("ascii"),
+                )
+            with open(self.file_path, "ab") as archive_file:
+                # DROP A RECORD LEFT HALF WRITTEN BY AN INTERRUPTED APPEND
+                size = archive_file.tell()
+                archive_file.truncate(size - size % RECORD_DTYPE.itemsize)
+                archive_file.write(records.tobytes())
+
+    def records(self) -> np.ndarray:
+        """Map every complete record of the archive read-only."""
+        if not path.exists(self.file_path):
+            return np.zeros(0, dtype=RECORD_DTYPE)
+        count = path.getsize(self.file_path) // RECORD_DTYPE.itemsize
+        if count == 0:
+            return np.zeros(0, dtype=RECORD_DTYPE)
+        return np.memmap(
+            self.file_path,
+            dtype=RECORD_DTYPE,
+            mode="r",
+            shape=(count,),
+        )
+
+    def issued_between(self, start: int, end: int) -> np.ndarray:
+        """Get a view of the records fetched in [start, end)."""
+        records = self.records()
+        first, last = np.searchsorted(records["issued"], [start, end])
+        return records[first:last]
+
+    def observations(self, start: int, end: int) -> np.ndarray:
+        """Get the observations valid in [start, end), oldest first."""
+        records = self.issued_between(start - 3600, end + 3600)
+        mask = (
+            (records["kind"] == OBSERVATION)
+            & (records["valid"] >= start)
+            & (records["valid"] < end)
+        )
+        return records[mask]
+
+    def forecasts(
+        self,
+        start: int,
+        end: int,
+        issued_before=None,
+    ) -> np.ndarray:
+        """Get the latest forecast for every time valid in [start, end).
+
+        With ``issued_before`` only forecasts fetched before that time are
+        used, which gives what was predicted back then for a
+        forecast-vs-actual comparison.
+        """
+        issued_end = end + 3600
+        if issued_before is not None:
+            issued_end = min(issued_end, issued_before)
+        records = self.issued_between(start - FORECAST_HORIZON, issued_end)
+        mask = (
+            (records["kind"] == FORECAST)
+            & (records["valid"] >= start)
+            & (records["valid"] < end)
+        )
+        records = records[mask]
+        # KEEP THE LAST ISSUED RECORD FOR EACH VALID TIME
+        reverse = records[::-1]
+        _, index = np.unique(reverse["valid"], return_index=True)
+        return reverse[index]
+
+    def history(self, start: int, end: int) -> dict:
+        """Get (valid, temp) of observations and forecasts for a chart."""
+        observed = self.observations(start, end)
+        forecast = self.forecasts(start, end)
+        return {
+            "observed": list(
+                zip(observed["valid"].tolist(), observed["temp"].tolist()),
+            ),
+            "forecast": list(
+                zip(forecast["valid"].tolist(), forecast["temp"].tolist()),
+            ),
+        }
+
+    def prune(self, before: int):
+        """Drop the records fetched before the unix time before."""
+        with self.__lock:
+            records = self.records()
+            first = int(np.searchsorted(records["issued"], before))
+            if first == 0:
+                return
+            temp_path = self.file_path + ".tmp"
+            with open(temp_path, "wb") as archive_file:
+                archive_file.write(records[first:].tobytes())
+            # CLOSE THE MAP BEFORE THE FILE IS REPLACED
+            del records
+            replace(temp_path, self.file_path)
+
+    def __last_issued(self) -> int:
+        """Get issued time of the last record to keep the file ordered."""
+        if not path.exists(self.file_path):
+            return 0
+        size = path.getsize(self.file_path)
+        count = size // RECORD_DTYPE.itemsize
+        if count == 0:
+            return 0
+        with open(self.file_path, "rb") as archive_file:
+            archive_file.seek((count - 1) * RECORD_DTYPE.itemsize)
+            last = np.frombuffer(
+                archive_file.read(RECORD_DTYPE.itemsize),
+                dtype=RECORD_DTYPE,
+            )
+        return int(last["issued"][0])
@@ -0,0 +1,96 @@
+"""Temperature chart shared by the Tk app and the batch renderer."""
+from datetime import datetime
+
+import matplotlib.dates as mdates
+import matplotlib.figure as fig
+
+# COLORS OF THE APP
+BG_COLOR = "#204c8a"
+TEXT_COLOR = "#fefefe"
+OBSERVED_COLOR = "#ffd166"
+
+# CHART SIZE
+CHART_FIGSIZE = (430 / 80, 220 / 80)
+CHART_DPI = 85
+
+
+def new_chart_figure() -> fig.Figure:
+    """Create an empty figure with the chart style of the app."""
+    figure = fig.Figure(figsize=CHART_FIGSIZE, dpi=CHART_DPI)
+    figure.patch.set_facecolor(BG_COLOR)
+    return figure
+
+
+def draw_temperature_chart(
+    figure: fig.Figure,
+    hourly_data: list,
+    history=None,
+):
+    """Draw hourly temperatures on figure, replacing what was drawn.
+
+    history is ForecastArchive.history of the location. When it has
+    observations they are drawn on a time axis before the forecast, with
+    the archived forecast of the same times to compare.
+    """
+    figure.clear()
+    a_x = figure.add_subplot(111)
+
+    # EXTRACT HOURS AND TEMP
+    hours = [weather["hour"] for weather in hourly_data]
+    temperatures = [weather["temp"] for weather in hourly_data]
+
+    if history and history["observed"]:
+        draw_history(a_x, history)
+        hours = [_utc(weather["dt"]) for weather in hourly_data]
+
+    # CREATE CHART
+    a_x.plot(
+        hours,
+        temperatures,
+        marker="o",
+        color="white",
+        linestyle="-",
+        label="Forecast",
+    )
+    if history and history["observed"]:
+        a_x.legend(fontsize=7, facecolor=BG_COLOR, labelcolor=TEXT_COLOR)
+    a_x.set_xlabel("Hour")
+    a_x.set_ylabel("Temperature (°C)")
+
+    # SET BG CHART
+    a_x.set_facecolor((0, 0, 0, 0.1))
+
+    a_x.xaxis.label.set_color("white")
+    a_x.yaxis.label.set_color("white")
+    a_x.tick_params(axis="x", colors="white")
+    a_x.tick_params(axis="y", colors="white")
+
+
+def draw_history(a_x, history: dict):
+    """Draw archived observations and the forecasts made for them."""
+    if history["forecast"]:
+        times, temperatures = zip(*history["forecast"])
+        a_x.plot(
+            [_utc(valid) for valid in times],
+            temperatures,
+            color="white",
+            linestyle="--",
+            alpha=0.6,
+            label="Past forecast",
+        )
+    times, temperatures = zip(*history["observed"])
+    a_x.plot(
+        [_utc(valid) for valid in times],
+        temperatures,
+        marker=".",
+        color=OBSERVED_COLOR,
+        linestyle="-",
+        label="Observed",
+    )
+    a_x.xaxis.set_major_formatter(mdates.DateFormatter("%a %H:%M"))
+    a_x.tick_params(axis="x", labelsize=7)
+
+
+def _utc(timestamp: int) -> datetime:
+    """Get UTC datetime, like the hours of the forecast."""
+    return datetime.utcfromtimestamp(timestamp)
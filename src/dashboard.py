@@ -0,0 +1,324 @@
+"""Dashboard with a compact tile for each of many locations."""
+import queue
+import threading
+import tkinter as tk
+from typing import NamedTuple, Optional
+
+from charts import BG_COLOR, TEXT_COLOR
+from pipeline import FETCH_ERRORS
+
+# TILE SIZE
+TILE_WIDTH = 180
+TILE_HEIGHT = 100
+TILE_GAP = 10
+COLUMNS = 5
+
+# POLL RESULTS OF THE REFRESH THREAD EVERY (ms)
+POLL_INTERVAL = 200
+
+TILE_COLOR = "#315793"
+
+# DATA OF A LOCATION WHOSE FETCH FAILED, LIKE THE SEARCH PLACEHOLDERS
+UNAVAILABLE: dict = {}
+
+
+class DashboardSettings(NamedTuple):
+    """Locations of the dashboard and how often they are fetched."""
+
+    locations: list
+    refresh_minutes: float = 10
+
+
+class _Tile:
+    """Widgets of one tile, moved around the canvas and reused."""
+
+    def __init__(self, canvas: tk.Canvas, icon):
+        """Initialize class _Tile."""
+        self.canvas = canvas
+        self.icon = icon
+        frame = tk.Frame(
+            canvas,
+            width=TILE_WIDTH,
+            height=TILE_HEIGHT,
+            bg=TILE_COLOR,
+        )
+        self.labels = {
+            "city": tk.Label(
+                frame,
+                fg=TEXT_COLOR,
+                bg=TILE_COLOR,
+                font=("Roboto Bold", 9),
+            ),
+            "icon": tk.Label(
+                frame,
+                bg=TILE_COLOR,
+            ),
+            "temp": tk.Label(
+                frame,
+                fg=TEXT_COLOR,
+                bg=TILE_COLOR,
+                font=("Roboto Regular", 20),
+            ),
+            "weather": tk.Label(
+                frame,
+                fg=TEXT_COLOR,
+                bg=TILE_COLOR,
+                font=("Roboto Regular", 9),
+            ),
+        }
+        self.labels["city"].place(
+            x=8,
+            y=5,
+        )
+        self.labels["icon"].place(
+            x=5,
+            y=30,
+            width=50,
+            height=50,
+        )
+        self.labels["temp"].place(
+            x=60,
+            y=30,
+        )
+        self.labels["weather"].place(
+            x=60,
+            y=70,
+        )
+        self.window = canvas.create_window(
+            0,
+            0,
+            window=frame,
+            anchor="nw",
+        )
+        self.shown: Optional[tuple] = None
+
+    def show(self, x_pos: int, y_pos: int, city: str, get_data):
+        """Move tile and redraw it only if its content changed."""
+        self.canvas.coords(self.window, x_pos, y_pos)
+        self.canvas.itemconfigure(self.window, state="normal")
+        state: tuple
+        if get_data is None:
+            state = (city, None, None, "Loading...")
+        elif not get_data:
+            state = (city, None, None, "Not available")
+        else:
+            state = (
+                city,
+                get_data["icon"],
+                f"{get_data['temp']:.0f}°",
+                get_data["weather"],
+            )
+        if state == self.shown:
+            return
+        self.shown = state
+        self.labels["city"].configure(text=state[0])
+        self.labels["icon"].configure(
+            image=self.icon(state[1]) if state[1] else "",
+        )
+        self.labels["temp"].configure(text=state[2] or "")
+        self.labels["weather"].configure(text=state[3])
+
+    def hide(self):
+        """Hide tile until it is reused."""
+        self.canvas.itemconfigure(self.window, state="hidden")
+
+
+class _TilePool:
+    """Tiles in view by location number, and hidden ones to reuse."""
+
+    def __init__(self, canvas: tk.Canvas, load_image):
+        """Initialize class _TilePool."""
+        self.canvas = canvas
+        self.load_image = load_image
+        self.icons: dict = {}
+        self.tiles: dict = {}
+        self.free: list = []
+
+    def icon(self, icon_name: str):
+        """Get icon of tiles, loaded once for the whole dashboard."""
+        if icon_name not in self.icons:
+            self.icons[icon_name] = self.load_image(icon_name, 50, 50)
+        return self.icons[icon_name]
+
+    def keep(self, visible: range):
+        """Hide the tiles out of visible and give one to each in it."""
+        for index in list(self.tiles):
+            if index not in visible:
+                tile = self.tiles.pop(index)
+                tile.hide()
+                self.free.append(tile)
+        for index in visible:
+            if index not in self.tiles:
+                if self.free:
+                    self.tiles[index] = self.free.pop()
+                else:
+                    self.tiles[index] = _Tile(self.canvas, self.icon)
+
+
+class _Feed:
+    """Fetch current weather of the locations on a background thread."""
+
+    def __init__(self, locations: list, weather_data):
+        """Initialize class _Feed."""
+        self.locations = locations
+        self.weather_data = weather_data
+        self.sources: dict = {}
+        self.results: queue.Queue = queue.Queue()
+        self.fetching = threading.Event()
+
+    def start(self):
+        """Fetch all locations, unless the last fetch is still running."""
+        if not self.fetching.is_set():
+            self.fetching.set()
+            threading.Thread(target=self.__fetch_all, daemon=True).start()
+
+    def ready(self) -> list:
+        """Get (location number, data) fetched since the last call."""
+        results = []
+        while not self.results.empty():
+            results.append(self.results.get())
+        return results
+
+    def __fetch_all(self):
+        """Get current weather of every location, one at a time."""
+        try:
+            for index, city in enumerate(self.locations):
+                get_data = UNAVAILABLE
+                try:
+                    if city not in self.sources:
+                        self.sources[city] = self.weather_data(city)
+                    get_data = self.sources[city].current_data()
+                except FETCH_ERRORS:
+                    pass
+                finally:
+                    # A FAILED CITY SHOWS IT, NOT "Loading..." FOREVER
+                    self.results.put((index, get_data))
+        finally:
+            # ANY ERROR MUST NOT STOP THE NEXT REFRESH
+            self.fetching.clear()
+
+
+class Dashboard:
+    """Show current weather of many locations in a scrollable grid.
+
+    Only the tiles in view have widgets. Tiles scrolled out of view are
+    hidden and reused for the ones scrolled in, so the number of widgets
+    depends on the window size and not on the number of locations.
+    """
+
+    def __init__(
+        self,
+        root: tk.Tk,
+        settings: DashboardSettings,
+        weather_data,
+        load_image,
+    ):
+        """Initialize class Dashboard."""
+        self.settings = settings
+        self.__data: list = [None] * len(settings.locations)
+        self.__feed = _Feed(settings.locations, weather_data)
+
+        self.window = tk.Toplevel(root)
+        self.window.title("Dashboard")
+        self.window.configure(bg=BG_COLOR)
+        width = COLUMNS * (TILE_WIDTH + TILE_GAP) + TILE_GAP
+        self.window.geometry(f"{width + 20}x600")
+
+        rows = -(-len(settings.locations) // COLUMNS)
+        self.canvas = tk.Canvas(
+            self.window,
+            bg=BG_COLOR,
+            highlightthickness=0,
+            scrollregion=(
+                0,
+                0,
+                width,
+                rows * (TILE_HEIGHT + TILE_GAP) + TILE_GAP,
+            ),
+        )
+        self.__pool = _TilePool(self.canvas, load_image)
+        scrollbar = tk.Scrollbar(
+            self.window,
+            orient="vertical",
+            command=self.__yview,
+        )
+        self.canvas.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.canvas.bind("<Configure>", lambda event: self.show_visible())
+        # THE WINDOW IS IN THE BINDTAGS OF THE TILES TOO, SO THE WHEEL
+        # SCROLLS OVER THEM AND NOT ONLY OVER THE GAPS
+        self.window.bind(
+            "<MouseWheel>",
+            lambda event: self.__yview(
+                "scroll",
+                -1 if event.delta > 0 else 1,
+                "units",
+            ),
+        )
+        self.window.bind(
+            "<Button-4>",
+            lambda event: self.__yview("scroll", -1, "units"),
+        )
+        self.window.bind(
+            "<Button-5>",
+            lambda event: self.__yview("scroll", 1, "units"),
+        )
+
+        self.show_visible()
+        self.refresh()
+        self.window.after(POLL_INTERVAL, self.__poll_results)
+
+    def show_visible(self):
+        """Give widgets to the tiles in view and take them from the rest."""
+        top = self.canvas.canvasy(0)
+        bottom = self.canvas.canvasy(self.canvas.winfo_height())
+        first_row = int(top // (TILE_HEIGHT + TILE_GAP))
+        last_row = int(bottom // (TILE_HEIGHT + TILE_GAP))
+        visible = range(
+            first_row * COLUMNS,
+            min(len(self.settings.locations), (last_row + 1) * COLUMNS),
+        )
+        self.__pool.keep(visible)
+        for index in visible:
+            self.__show_tile(index)
+
+    def refresh(self):
+        """Fetch all locations again in the background."""
+        if not self.window.winfo_exists():
+            return
+        self.__feed.start()
+        self.window.after(
+            int(self.settings.refresh_minutes * 60 * 1000),
+            self.refresh,
+        )
+
+    def __show_tile(self, index: int):
+        """Draw tile of location number index."""
+        row, column = divmod(index, COLUMNS)
+        self.__pool.tiles[index].show(
+            TILE_GAP + column * (TILE_WIDTH + TILE_GAP),
+            TILE_GAP + row * (TILE_HEIGHT + TILE_GAP),
+            self.settings.locations[index],
+            self.__data[index],
+        )
+
+    def __poll_results(self):
+        """Redraw tiles of locations whose weather changed."""
+        if not self.window.winfo_exists():
+            return
+        for index, get_data in self.__feed.ready():
+            if get_data == self.__data[index]:
+                continue
+            # A FAILED REFRESH KEEPS THE LAST DATA OF THE LOCATION
+            if not get_data and self.__data[index]:
+                continue
+            self.__data[index] = get_data
+            if index in self.__pool.tiles:
+                self.__show_tile(index)
+        self.window.after(POLL_INTERVAL, self.__poll_results)
+
+    def __yview(self, *args):
+        """Scroll canvas and update tiles in view."""
+        self.canvas.yview(*args)
+        self.show_visible()
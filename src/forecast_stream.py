@@ -0,0 +1,91 @@
+"""Decode only the fields the app uses from a 5 day forecast response.
+
+With ijson installed the response is parsed while it is downloaded and no
+dict is built for the 40 slots. Otherwise orjson, or the json module of
+requests, parses the whole document and the fields are picked from it.
+"""
+from typing import Any, NamedTuple
+
+# OPTIONAL, BOTH ARE ONLY FASTER WAYS TO GET THE SAME RECORDS
+ijson: Any
+orjson: Any
+try:
+    import ijson  # type: ignore
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ForecastRecord(NamedTuple):
+    """One 3-hour slot of the forecast."""
+
+    dt: int
+    temp: float
+    humidity: int
+    icon: str
+
+
+def forecast_records(res) -> list:
+    """Get a ForecastRecord for every slot of a requests response.
+
+    Open res with stream=True so ijson can read it while it arrives. An
+    error status raises requests.HTTPError and a body without a forecast
+    list ValueError, instead of giving no records.
+    """
+    res.raise_for_status()
+    if ijson is not None:
+        res.raw.decode_content = True
+        try:
+            return _stream_records(ijson.parse(res.raw, use_float=True))
+        except ijson.JSONError as error:
+            # THE OTHER DECODERS RAISE VALUEERROR FOR A BAD BODY TOO
+            raise ValueError(f"bad forecast response: {error}") from error
+    if orjson is not None:
+        json = orjson.loads(res.content)
+    else:
+        json = res.json()
+    return [
+        ForecastRecord(
+            item["dt"],
+            item["main"]["temp"],
+            item["main"]["humidity"],
+            item["weather"][0]["icon"],
+        )
+        for item in _forecast_list(json)
+    ]
+
+
+def _forecast_list(json: dict) -> list:
+    """Get the slots of a decoded forecast, which must have them."""
+    if not isinstance(json.get("list"), list):
+        raise ValueError(f"no forecast list in response: {json}")
+    return json["list"]
+
+
+def _stream_records(events) -> list:
+    """Build records from ijson events, skipping every other field."""
+    records = []
+    fields: dict = {}
+    seen_list = False
+    for prefix, event, value in events:
+        if prefix == "list" and event == "start_array":
+            seen_list = True
+        elif prefix == "list.item.dt":
+            fields["dt"] = value
+        elif prefix == "list.item.main.temp":
+            fields["temp"] = value
+        elif prefix == "list.item.main.humidity":
+            fields["humidity"] = value
+        elif prefix == "list.item.weather.item.icon":
+            # THE FIRST WEATHER CONDITION IS THE MAIN ONE
+            fields.setdefault("icon", value)
+        elif prefix == "list.item" and event == "end_map":
+            records.append(ForecastRecord(**fields))
+            fields = {}
+    if not seen_list:
+        raise ValueError("no forecast list in response")
+    return records
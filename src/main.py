@@ -1,25 +1,74 @@
 """Import the necessary modules to build the weather app."""
+import functools
 import threading
 import time
 import tkinter as tk
 from configparser import ConfigParser
 from datetime import datetime, timedelta
-from os import path
+from typing import Optional
 
-import matplotlib.figure as fig
 import requests
 from geopy.geocoders import Nominatim  # type: ignore
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from PIL import Image, ImageTk
+
+import providers
+from archive import ForecastArchive
+from dashboard import Dashboard, DashboardSettings
+from forecast_stream import forecast_records
+from panels import WeatherPanels, img_path
+from pipeline import SearchPipeline, SearchView
+from ratelimit import BACKGROUND, INTERACTIVE, RateLimiter, open_store
 
 # GET API FROM CONFIG FILE
 CONFIG_FILE = "config.ini"
 config = ConfigParser()
 config.read(CONFIG_FILE)
 api_key = config["api_key"]["key"]
+provider_mode = config.get("provider", "mode", fallback="forecast")
+archive_dir = config.get("archive", "directory", fallback="archive")
+archive_history = config.getfloat("archive", "history_days", fallback=2)
+archive_retention = config.getfloat("archive", "retention_days", fallback=365)
+dashboard_locations = [
+    city.strip()
+    for city in config.get("dashboard", "locations", fallback="").split(",")
+    if city.strip()
+]
+dashboard_refresh = config.getfloat(
+    "dashboard",
+    "refresh_minutes",
+    fallback=10,
+)
 
-# IMAGE PATH
-img_path = path.join("assets", "images") + path.sep
+# SEARCH DEADLINE (s), LATE PANELS SHOW CACHED OR PLACEHOLDER DATA
+search_deadline = config.getfloat("search", "deadline", fallback=8)
+SEARCH_POLL_INTERVAL = 50
+# RESPONSES ARE SHARED BY THE PANELS OF A SEARCH, NOT REUSED ON REFRESH (s)
+RESPONSE_TTL = 60
+SEARCH_PLACEHOLDERS: dict = {
+    "city": {"city": "", "state": "", "country": "Location not available"},
+    "current": {},
+    "future": [],
+    "hourly": [],
+    "history": {},
+}
+
+# RATE LIMITS OF UPSTREAM APIS, SHARED BY THREADS (AND PROCESSES WITH STORE)
+if not config.has_section("rate_limit"):
+    config.add_section("rate_limit")
+rate_config = config["rate_limit"]
+limit_store = open_store(rate_config.get("store", "rate_limits.sqlite3"))
+openweather_limiter = RateLimiter(
+    "openweather",
+    [
+        (rate_config.getint("openweather_per_minute", 60), 60),
+        (rate_config.getint("openweather_per_day", 1000), 86400),
+    ],
+    limit_store,
+)
+nominatim_limiter = RateLimiter(
+    "nominatim",
+    [(rate_config.getint("nominatim_per_second", 1), 1)],
+    limit_store,
+)
 
 # CURRENT DATETIME
 current_datetime = datetime.now()
@@ -34,125 +83,95 @@ day_name = current_datetime.strftime("%a")  # Thu
 cr_date = day_name + " " + day_of_month
 
 
-class WeatherData:
+class WeatherData:  # pylint: disable=too-many-instance-attributes
     """Get weather data."""
 
-    def __init__(self, city_name: str):
-        """Initialize class WeatherData."""
+    def __init__(
+        self,
+        city_name: str,
+        priority: int = INTERACTIVE,
+        deadline=None,
+    ):
+        """Initialize class WeatherData.
+
+        deadline is a time.monotonic() value after which requests fail
+        with TimeoutError instead of being sent.
+        """
+        self.priority = priority
+        self.deadline = deadline
+        self.__lock = threading.Lock()
         self.geolocator = Nominatim(user_agent="App weather")
         get_lat_lon = self.__get_lat_lon(city_name)
         self.__latitude = get_lat_lon["lat"]
         self.__longitude = get_lat_lon["lon"]
+        self.__responses: dict = {}
+        # THE ARCHIVE IS BEST EFFORT, IT MUST NOT STOP LIVE WEATHER
+        self.archive: Optional[ForecastArchive] = None
+        try:
+            self.archive = ForecastArchive(
+                archive_dir,
+                self.__latitude,
+                self.__longitude,
+                archive_retention,
+            )
+        except OSError:
+            pass
 
     def current_data(self):
         """Get current weather data."""
-        openweather_url = "https://api.openweathermap.org/data/2.5/weather?"
-        url = (
-            f"{openweather_url}"
-            f"lat={self.__latitude}&lon={self.__longitude}"
-            f"&units=metric&appid={api_key}"
+        if provider_mode == "onecall":
+            json = self.__one_call()
+            current = json["current"]
+            self.__store(
+                ForecastArchive.append_observation,
+                current["dt"],
+                current["temp"],
+                current["humidity"],
+                current["weather"][0]["icon"],
+            )
+            return providers.one_call_current(json)
+        json = self.__get_json(
+            "https://api.openweathermap.org/data/2.5/weather?",
+            15,
         )
-        res = requests.get(
-            url,
-            "GET",
-            timeout=15,
+        self.__store(
+            ForecastArchive.append_observation,
+            json["dt"],
+            json["main"]["temp"],
+            json["main"]["humidity"],
+            json["weather"][0]["icon"],
         )
-        json = res.json()
-        return {
-            "weather": json["weather"][0]["main"],
-            "description": json["weather"][0]["description"],
-            "icon": json["weather"][0]["icon"],
-            "temp": json["main"]["temp"],
-            "feels_like": json["main"]["feels_like"],
-            "temp_min": json["main"]["temp_min"],
-            "temp_max": json["main"]["temp_max"],
-            "pressure": json["main"]["pressure"],
-            "humidity": json["main"]["humidity"],
-            "wind": json["wind"]["speed"],
-            "visibility": json["visibility"],
-        }
+        return providers.weather_current(json)
 
     def future_data(self):
         """Get future weather data."""
-        openweather_url = "https://api.openweathermap.org/data/2.5/forecast?"
-        url = (
-            f"{openweather_url}"
-            f"lat={self.__latitude}&lon={self.__longitude}"
-            f"&units=metric&appid={api_key}"
-        )
-        res = requests.get(
-            url,
-            "GET",
-            timeout=10,
-        )
-        json = res.json()
-        daily_weather = []
-        for item in json["list"]:
-            date_time = datetime.utcfromtimestamp(item["dt"])
-
-            if date_time.hour == 12 and date_time > current_datetime:
-                daily_weather.append(item)
-        daily_list = []
-        for weather in daily_weather:
-            dt_txt = weather["dt_txt"]
-            weather_datetime = datetime.strptime(dt_txt, "%Y-%m-%d %H:%M:%S")
-            days_of_the_week = weather_datetime.strftime("%a")
-            days_of_the_month = weather_datetime.strftime("%d")
-            date_day = days_of_the_week + " " + days_of_the_month
-            daily_list.append(
-                {
-                    "date": date_day,
-                    "temp": weather["main"]["temp"],
-                    "humidity": weather["main"]["humidity"],
-                    "icon": weather["weather"][0]["icon"],
-                },
-            )
-        return daily_list
+        if provider_mode == "onecall":
+            return providers.one_call_daily(self.__one_call())
+        return providers.forecast_daily(self.__forecast(), current_datetime)
 
     def hourly_data(self):
         """Get hourly weather data."""
-        openweather_url = "https://api.openweathermap.org/data/2.5/forecast?"
-        url = (
-            f"{openweather_url}"
-            f"lat={self.__latitude}&lon={self.__longitude}"
-            f"&units=metric&appid={api_key}"
-        )
-        res = requests.get(
-            url,
-            "GET",
-            timeout=10,
-        )
-        json = res.json()
-        hourly_weather = []
         td_day = datetime.now()
         tm_date = td_day + timedelta(days=1)
         today_date = tm_date.strftime("%Y-%m-%d")
-        for item in json["list"]:
-            if item["dt_txt"].startswith(today_date):
-                hourly_weather.append(item)
-        hourly_list = []
-        for weather in hourly_weather:
-            dt_txt_parts = weather["dt_txt"].split(" ")[-1].split(":")
-            hour = int(dt_txt_parts[0])
-            hour_data = {
-                "hour": hour if hour <= 12 else hour - 12 if hour > 12 else 12,
-                "am_pm": "AM" if hour < 12 else "PM",
-            }
-            hourly_list.append(
-                {
-                    "hour": f"{hour_data['hour']} {hour_data['am_pm']}",
-                    "temp": weather["main"]["temp"],
-                    "humidity": weather["main"]["humidity"],
-                    "icon": weather["weather"][0]["icon"],
-                },
-            )
-        return hourly_list
+        if provider_mode == "onecall":
+            return providers.one_call_hourly(self.__one_call(), today_date)
+        return providers.forecast_hourly(self.__forecast(), today_date)
+
+    def chart_history(self) -> dict:
+        """Get archived weather of the last days for the chart."""
+        if self.archive is None:
+            return {"observed": [], "forecast": []}
+        end = int(time.time())
+        return self.archive.history(end - int(archive_history * 86400), end)
 
     def get_info_city(self):
         """Get Info about city."""
+        self.__acquire(nominatim_limiter)
         location = self.geolocator.reverse(
             str(self.__latitude) + "," + str(self.__longitude),
             language="en",
+            timeout=self.__budget(self.geolocator.timeout),
         )
         address = location.raw["address"]
         city = address.get("city", "").title()
@@ -168,16 +187,96 @@ class WeatherData:
             "country": country,
         }
 
+    def __get_json(self, openweather_url: str, timeout: int) -> dict:
+        """Get response of an OpenWeather endpoint for the location."""
+        return self.__request(openweather_url, timeout).json()
+
+    def __request(self, openweather_url: str, timeout: int, stream=False):
+        """Send request to an OpenWeather endpoint for the location."""
+        url = (
+            f"{openweather_url}"
+            f"lat={self.__latitude}&lon={self.__longitude}"
+            f"&units=metric&appid={api_key}"
+        )
+        self.__acquire(openweather_limiter)
+        return requests.get(
+            url,
+            "GET",
+            timeout=self.__budget(timeout),
+            stream=stream,
+        )
+
+    def __acquire(self, limiter: RateLimiter):
+        """Wait for the rate limit of an upstream within the deadline."""
+        if not limiter.acquire(self.priority, self.__budget(None)):
+            raise TimeoutError(f"deadline passed waiting for {limiter.name}")
+
+    def __budget(self, timeout):
+        """Cut timeout to the time left before the deadline."""
+        if self.deadline is None:
+            return timeout
+        left = self.deadline - time.monotonic()
+        if left <= 0:
+            raise TimeoutError("deadline passed")
+        return left if timeout is None else min(timeout, left)
+
+    def __forecast(self) -> list:
+        """Get 5 day forecast, shared by future and hourly data."""
+        with self.__lock:
+            if self.__stale("forecast"):
+                with self.__request(
+                    "https://api.openweathermap.org/data/2.5/forecast?",
+                    10,
+                    stream=True,
+                ) as res:
+                    records = forecast_records(res)
+                self.__store(ForecastArchive.append_forecast, records)
+                self.__responses["forecast"] = (time.monotonic(), records)
+            return self.__responses["forecast"][1]
+
+    def __one_call(self) -> dict:
+        """Get current, hourly and daily data in one request."""
+        with self.__lock:
+            if self.__stale("onecall"):
+                json = self.__get_json(
+                    providers.ONE_CALL_URL + "exclude=minutely,alerts&",
+                    15,
+                )
+                self.__store(
+                    ForecastArchive.append_forecast,
+                    providers.one_call_samples(json),
+                )
+                self.__responses["onecall"] = (time.monotonic(), json)
+            return self.__responses["onecall"][1]
+
+    def __store(self, append, *sample):
+        """Append to the archive, skipped when it cannot be written."""
+        if self.archive is None:
+            return
+        try:
+            append(self.archive, *sample)
+        except OSError:
+            pass
+
+    def __stale(self, name: str) -> bool:
+        """Check if response name is missing or older than RESPONSE_TTL."""
+        fetched = self.__responses.get(name)
+        return fetched is None or time.monotonic() - fetched[0] > RESPONSE_TTL
+
     def __get_lat_lon(self, city_name: str) -> dict:
         """Get longitude and latitude."""
-        location = self.geolocator.geocode(city_name)
+        self.__acquire(nominatim_limiter)
+        location = self.geolocator.geocode(
+            city_name,
+            timeout=self.__budget(self.geolocator.timeout),
+        )
         return {
             "lat": location.latitude,
             "lon": location.longitude,
         }
 
 
-class WeatherApp:
+class WeatherApp(WeatherPanels):
     """Class to manage the app and UI."""
 
     def __init__(
@@ -208,6 +307,9 @@ class WeatherApp:
         }
         # CITY NAME
         self.__city_name = tk.StringVar()
+        # RUNNING SEARCH AND LAST DATA OF EVERY SEARCHED CITY
+        self.__search = None
+        self.__search_cache: dict = {}
 
         # SEARCH BAR
         self.search_bar()
@@ -240,6 +342,37 @@ class WeatherApp:
             y=6,
         )
 
+        # BUTTON DASHBOARD
+        if dashboard_locations:
+            dashboard_btn = tk.Button(
+                self.root,
+                text="Dashboard",
+                font=("Roboto Regular", 10),
+                borderwidth=0,
+                bg="#171717",
+                fg="#fefefe",
+                activebackground="#204c8a",
+                activeforeground="#fefefe",
+                command=self.show_dashboard,
+            )
+            dashboard_btn.place(
+                x=130,
+                y=11,
+            )
+
+        # REQUESTS LEFT OF THE OPENWEATHER LIMITS
+        self.__quota_lbl = tk.Label(
+            self.root,
+            font=("Roboto Regular", 9),
+            bg="#171717",
+            fg="#fefefe",
+        )
+        self.__quota_lbl.place(
+            x=240,
+            y=14,
+        )
+        self.show_quota()
+
         # BACKGROUND SEARCH INPUT
         search_entry_bg = tk.Label(
             self.root,
@@ -304,521 +437,84 @@ class WeatherApp:
             y=50,
         )
 
-    def set_current_weather(self):
-        """Set current weather."""
-
-        def update_weather():
-            get_data = WeatherData(self.__city_name.get()).current_data()
-            my_var = {
-                "wind": (int(get_data["wind"]) * 3600) / 1000,
-                "feels_like": str(int(get_data["feels_like"])),
-                "vis": int(get_data["visibility"]),
-                "get_info_city": WeatherData(
-                    self.__city_name.get(),
-                ).get_info_city(),
-                "get_fu_data": WeatherData(
-                    self.__city_name.get(),
-                ).future_data(),
-                "get_hourly_data": WeatherData(
-                    self.__city_name.get(),
-                ).hourly_data(),
-            }
-            time.sleep(0.5)
-            self.city_info_data.configure(
-                text=my_var["get_info_city"]["city"]
-                + my_var["get_info_city"]["state"]
-                + my_var["get_info_city"]["country"],
-            )
-
-            frame = tk.Frame(
-                self.root,
-                width=490,
-                height=220,
-                bg="#204c8a",
-            )
-            frame.place(
-                x=40,
-                y=80,
-            )
-            cr_lbl = tk.Label(
-                frame,
-                image=self.images["current_bg"],
-                bg="#204c8a",
-            )
-            cr_lbl.place(
-                x=0,
-                y=0,
-            )
-            cr_weather_text = tk.Label(
-                frame,
-                text="Current weather",
-                bg="#174384",
-                fg="#fefefe",
-                font=("Roboto Bold", 11),
-            )
-            cr_weather_text.place(
-                x=9,
-                y=13,
-            )
-            self.images["current_icon"] = self.load_image(get_data["icon"])
-            cr_weather_icon_lbl = tk.Label(
-                frame,
-                image=self.images["current_icon"],
-                bg="#174384",
-            )
-            cr_weather_icon_lbl.place(
-                x=2,
-                y=35,
-            )
-            cr_temp_text = tk.Label(
-                frame,
-                text=str(int(get_data["temp"])) + "°",
-                bg="#174384",
-                fg="#fefefe",
-                font=("Roboto Regular", 40),
-            )
-            cr_temp_text.place(
-                x=95,
-                y=55,
-            )
-            main_weather = tk.Label(
-                frame,
-                text=get_data["weather"],
-                bg="#174384",
-                fg="#fefefe",
-                font=("Roboto Black", 12),
-            )
-            main_weather.place(
-                x=199,
-                y=65,
-            )
-
-            feels_like = tk.Label(
-                frame,
-                text=f"feels like  {my_var['feels_like']}°",
-                bg="#174384",
-                fg="#fefefe",
-                font=("Roboto Regular", 10),
-            )
-            feels_like.place(
-                x=199,
-                y=90,
-            )
-            description = tk.Label(
-                frame,
-                text=get_data["description"]
-                + ". The high will be "
-                + str(int(get_data["temp_max"]))
-                + "°",
-                bg="#174384",
-                fg="#fefefe",
-                font=("Roboto Regular", 10),
-            )
-            description.place(
-                x=10,
-                y=128,
-            )
-
-            wind_speed = tk.Label(
-                frame,
-                text=f"Wind\n {int(my_var['wind'])} km/h",
-                bg="#174384",
-                fg="#fefefe",
-                font=("Roboto Regular", 10),
-            )
-            wind_speed.place(
-                x=10,
-                y=165,
-            )
-            humidity = tk.Label(
-                frame,
-                text=f"Humidity\n {get_data['humidity']}%",
-                bg="#174384",
-                fg="#fefefe",
-                font=("Roboto Regular", 10),
-            )
-            humidity.place(
-                x=90,
-                y=165,
-            )
-            visibility = tk.Label(
-                frame,
-                text=f"Visibility\n {my_var['vis'] / 1000:.0f} km",
-                bg="#174384",
-                fg="#fefefe",
-                font=("Roboto Regular", 10),
-            )
-            visibility.place(
-                x=170,
-                y=165,
-            )
-            pressure = tk.Label(
-                frame,
-                text=f"Pressure\n {int(get_data['pressure'])} mb",
-                bg="#174384",
-                fg="#fefefe",
-                font=("Roboto Regular", 10),
-            )
-            pressure.place(
-                x=250,
-                y=165,
-            )
-            self.set_daily_weather(
-                get_data,
-                my_var["get_fu_data"],
-            )
-            self.set_hourly_weather(
-                my_var["get_hourly_data"],
-            )
-
-        update_thread = threading.Thread(target=update_weather)
-
-        # Start the thread to execute the function in the background
-        update_thread.start()
+    def show_quota(self):
+        """Show requests left of every OpenWeather limit."""
+        remaining = openweather_limiter.metrics()["remaining"]
+        quota = [f"{left} of {limit}" for limit, left in remaining.items()]
+        self.__quota_lbl.configure(text="Requests left: " + ", ".join(quota))
 
-    def set_daily_weather(
-        self,
-        get_data: dict,
-        future_data: list,
-    ):
-        """Set daily weather."""
-        # SET FRAME
-        frame = tk.Frame(
+    def show_dashboard(self):
+        """Open dashboard of the locations in config file."""
+        Dashboard(
             self.root,
-            width=980,
-            height=140,
-            bg="#204c8a",
-        )
-        frame.place(
-            x=40,
-            y=310,
-        )
-        # LABEL TITLE
-        title_lbl = tk.Label(
-            frame,
-            fg="#fefefe",
-            bg="#204c8a",
-            font=("Roboto Bold", 10),
-            text="5 DAY FORECAST",
+            DashboardSettings(dashboard_locations, dashboard_refresh),
+            functools.partial(WeatherData, priority=BACKGROUND),
+            self.load_image,
         )
-        title_lbl.place(
-            x=0,
-            y=0,
-        )
-
-        def current_weather_box(frame_bg):
-            # BOX CURRENT
-            box_cr = tk.Frame(
-                frame_bg,
-                bg="#204c8a",
-            )
-            box_cr.place(
-                x=0,
-                y=25,
-                width=230,
-                height=120,
-            )
-            bg_box_cr = tk.Label(
-                box_cr,
-                bg="#204c8a",
-                image=self.images["cr_w_bg"],
-                border=0,
-            )
-            bg_box_cr.place(
-                x=0,
-                y=0,
-            )
-
-            date_lbl_one = tk.Label(
-                box_cr,
-                fg="#fefefe",
-                font=("Roboto Regular", 9),
-                text="Today",
-                bg="#315793",
-            )
-            date_lbl_one.place(
-                x=10,
-                y=5,
-            )
-            self.images["cr_resized_image"] = self.load_image(
-                get_data["icon"],
-                60,
-                60,
-            )
-            icon_lbl_one = tk.Label(
-                box_cr,
-                image=self.images["cr_resized_image"],
-                bg="#315793",
-            )
-            icon_lbl_one.place(
-                x=8,
-                y=25,
-                width=60,
-                height=60,
-            )
-            temp_lbl_one = tk.Label(
-                box_cr,
-                fg="#fefefe",
-                font=("Roboto Bold", 9),
-                text=f"{get_data['temp_max']:.0f}°",
-                bg="#315793",
-            )
-            temp_lbl_one.place(
-                x=75,
-                y=32,
-            )
-            humidity_lbl_one = tk.Label(
-                box_cr,
-                fg="#fefefe",
-                font=("Roboto Bold", 9),
-                text=f"{get_data['humidity']}%",
-                bg="#315793",
-            )
-            humidity_lbl_one.place(
-                x=75,
-                y=55,
-            )
-            weather_lbl_one = tk.Label(
-                box_cr,
-                fg="#fefefe",
-                font=("Roboto Bold", 10),
-                text=f"{get_data['weather']}",
-                bg="#315793",
-            )
-            weather_lbl_one.place(
-                x=125,
-                y=41,
-            )
-
-        current_weather_box(frame)
-        # SHOW OTHER DAYS WEATHER
-        x_box = 240
-        for weather in future_data:
-            box_future = tk.Frame(
-                frame,
-                bg="#204c8a",
-                width=120,
-                height=118,
-            )
-            box_future.place(
-                x=x_box,
-                y=25,
-            )
-            box_future_bg = tk.Label(
-                box_future,
-                bg="#204c8a",
-                image=self.images["other_w_bg"],
-                border=0,
-            )
-            box_future_bg.pack()
-
-            date_lbl_one = tk.Label(
-                box_future,
-                fg="#fefefe",
-                font=("Roboto Regular", 9),
-                text=weather["date"],
-                bg="#315793",
-            )
-            date_lbl_one.place(
-                x=10,
-                y=5,
-            )
-            self.images["fu_resized_img" + str(x_box)] = self.load_image(
-                weather["icon"],
-                60,
-                60,
-            )
-            icon_lbl_one = tk.Label(
-                box_future,
-                image=self.images["fu_resized_img" + str(x_box)],
-                bg="#315793",
-            )
-            icon_lbl_one.place(
-                x=8,
-                y=25,
-                width=60,
-                height=60,
-            )
-            temp_lbl_one = tk.Label(
-                box_future,
-                fg="#fefefe",
-                font=("Roboto Bold", 9),
-                text=f"{weather['temp']:.0f}°",
-                bg="#315793",
-            )
-            temp_lbl_one.place(
-                x=75,
-                y=32,
-            )
-            humidity_lbl_one = tk.Label(
-                box_future,
-                fg="#fefefe",
-                font=("Roboto Bold", 9),
-                text=f"{weather['humidity']}%",
-                bg="#315793",
-            )
-            humidity_lbl_one.place(
-                x=75,
-                y=55,
-            )
-            x_box += 130
 
-    def set_hourly_weather(
-        self,
-        hourly_data: list,
-    ):
-        """Set hourly forecast."""
-        frame_hou = tk.Frame(
-            self.root,
-            width=980,
-            height=150,
-            bg="#204c8a",
-        )
-        frame_hou.place(
-            x=40,
-            y=450,
+    def set_current_weather(self):
+        """Set current weather."""
+        city_name = self.__city_name.get()
+        sources = {
+            "city": WeatherData.get_info_city,
+            "current": WeatherData.current_data,
+            "future": WeatherData.future_data,
+            "hourly": WeatherData.hourly_data,
+            "history": WeatherData.chart_history,
+        }
+        self.__search = SearchPipeline(
+            lambda deadline: WeatherData(city_name, deadline=deadline),
+            sources,
+            search_deadline,
         )
-        # LABEL TITLE
-        title_lbl_hou = tk.Label(
-            frame_hou,
-            fg="#fefefe",
-            bg="#204c8a",
-            font=("Roboto Bold", 10),
-            text="HOURLY FORECAST",
+        view = SearchView(
+            list(sources),
+            self.__search_cache.setdefault(city_name.strip().lower(), {}),
+            SEARCH_PLACEHOLDERS,
         )
-        title_lbl_hou.place(
-            x=0,
-            y=0,
+        self.root.after(
+            SEARCH_POLL_INTERVAL,
+            self.__poll_search,
+            self.__search,
+            view,
         )
 
-        # SHOW OTHER DAYS WEATHER
-        count = 0
-        for num, weather_hou in enumerate(hourly_data):
-            if num == 0:
-                continue
-            box_future_hou = tk.Frame(
-                frame_hou,
-                bg="#204c8a",
-                width=120,
-                height=118,
-            )
-            box_future_hou.place(
-                x=count,
-                y=25,
-            )
-            box_future_bg_hou = tk.Label(
-                box_future_hou,
-                bg="#204c8a",
-                image=self.images["other_w_bg"],
-                border=0,
-            )
-            box_future_bg_hou.pack()
-
-            date_lbl_one_hou = tk.Label(
-                box_future_hou,
-                fg="#fefefe",
-                font=("Roboto Regular", 9),
-                text=f"{weather_hou['hour']}",
-                bg="#315793",
-            )
-            date_lbl_one_hou.place(
-                x=10,
-                y=5,
-            )
-            self.images["ico_resize" + str(count)] = self.load_image(
-                weather_hou["icon"],
-                60,
-                60,
-            )
-            icon_lbl_one_hou = tk.Label(
-                box_future_hou,
-                image=self.images["ico_resize" + str(count)],
-                bg="#315793",
-            )
-            icon_lbl_one_hou.place(
-                x=8,
-                y=25,
-                width=60,
-                height=60,
-            )
-            temp_lbl_one_hou = tk.Label(
-                box_future_hou,
-                fg="#fefefe",
-                font=("Roboto Bold", 9),
-                text=f"{weather_hou['temp']:.0f}°",
-                bg="#315793",
-            )
-            temp_lbl_one_hou.place(
-                x=75,
-                y=32,
-            )
-            humidity_lbl_one_hou = tk.Label(
-                box_future_hou,
-                fg="#fefefe",
-                font=("Roboto Bold", 9),
-                text=f"{weather_hou['humidity']}%",
-                bg="#315793",
-            )
-            humidity_lbl_one_hou.place(
-                x=75,
-                y=55,
+    def __poll_search(self, search: SearchPipeline, view: SearchView):
+        """Render every panel as soon as its data arrives."""
+        if search is not self.__search:
+            # A NEWER SEARCH REPLACED THIS ONE
+            return
+        expired = search.expired()
+        draws = view.arrived(search.ready(), expired)
+        if expired or search.done():
+            draws += view.fill()
+        for panel, *args in draws:
+            self.__draw_panel(panel, *args)
+        if search.done():
+            self.show_quota()
+        else:
+            self.root.after(
+                SEARCH_POLL_INTERVAL,
+                self.__poll_search,
+                search,
+                view,
             )
-            count += 130
-
-        # CHART FRAME
-        frame_ne = tk.Frame(
-            self.root,
-            width=400,
-            height=310,
-            bg="#204c8a",
-        )
-        frame_ne.place(
-            x=540,
-            y=70,
-        )
-
-        def chart():
-            figure = fig.Figure(figsize=(430 / 80, 220 / 80), dpi=85)
-            figure.patch.set_facecolor("#204c8a")
-
-            a_x = figure.add_subplot(111)
 
-            # EXTRACT HOURS AND TEMP
-            hours = [weather["hour"] for weather in hourly_data]
-            temperatures = [weather["temp"] for weather in hourly_data]
-
-            # CREATE CHART
-            a_x.plot(
-                hours,
-                temperatures,
-                marker="o",
-                color="white",
-                linestyle="-",
-            )
-            a_x.set_xlabel("Hour")
-            a_x.set_ylabel("Temperature (°C)")
-
-            # SET BG CHART
-            a_x.set_facecolor((0, 0, 0, 0.1))
-
-            a_x.xaxis.label.set_color("white")
-            a_x.yaxis.label.set_color("white")
-            a_x.tick_params(axis="x", colors="white")
-            a_x.tick_params(axis="y", colors="white")
-
-            # DISPLAY CHART
-            canvas = FigureCanvasTkAgg(figure, master=frame_ne)
-            canvas.get_tk_widget().pack()
-
-        chart()
-
-    @staticmethod
-    def load_image(img_name, width=None, height=None, resize=True):
-        """Load images and resize."""
-        image = Image.open(img_path + img_name + ".png")
-        if resize and (width is not None or height is not None):
-            image = image.resize((width, height), Image.Resampling.LANCZOS)
-        return ImageTk.PhotoImage(image)
+    def __draw_panel(self, panel: str, *args):
+        """Draw panel of a search with args of its drawing function."""
+        if panel == "city":
+            data = args[0]
+            self.city_info_data.configure(
+                text=data["city"] + data["state"] + data["country"],
+            )
+        elif panel == "current":
+            self.set_current_panel(*args)
+        elif panel == "daily":
+            self.set_daily_weather(*args)
+        elif panel == "hourly":
+            self.set_hourly_weather(*args)
+        elif panel == "chart":
+            self.set_chart(*args)
 
 
 run_app = WeatherApp("Weather app - Karyar", "icon.png")
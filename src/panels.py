@@ -0,0 +1,496 @@
+"""Panels of the weather app window."""
+import tkinter as tk
+from os import path
+
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from PIL import Image, ImageTk
+
+from charts import draw_temperature_chart, new_chart_figure
+
+# IMAGE PATH
+img_path = path.join("assets", "images") + path.sep
+
+
+class WeatherPanels:
+    """Draw the weather panels on the window of the app."""
+
+    root: tk.Tk
+    images: dict
+
+    def set_current_panel(self, get_data: dict):
+        """Set current weather panel, a placeholder if get_data is empty."""
+        frame = tk.Frame(
+            self.root,
+            width=490,
+            height=220,
+            bg="#204c8a",
+        )
+        frame.place(
+            x=40,
+            y=80,
+        )
+        cr_lbl = tk.Label(
+            frame,
+            image=self.images["current_bg"],
+            bg="#204c8a",
+        )
+        cr_lbl.place(
+            x=0,
+            y=0,
+        )
+        cr_weather_text = tk.Label(
+            frame,
+            text="Current weather",
+            bg="#174384",
+            fg="#fefefe",
+            font=("Roboto Bold", 11),
+        )
+        cr_weather_text.place(
+            x=9,
+            y=13,
+        )
+        if not get_data:
+            unavailable = tk.Label(
+                frame,
+                text="Not available, try again later",
+                bg="#174384",
+                fg="#fefefe",
+                font=("Roboto Regular", 12),
+            )
+            unavailable.place(
+                x=10,
+                y=80,
+            )
+            return
+        self.set_current_details(frame, get_data)
+
+    def set_current_details(self, frame: tk.Frame, get_data: dict):
+        """Set labels of current weather panel."""
+        wind: float = (int(get_data["wind"]) * 3600) / 1000
+        feels_like_temp: str = str(int(get_data["feels_like"]))
+        vis: int = int(get_data["visibility"])
+        self.images["current_icon"] = self.load_image(get_data["icon"])
+        cr_weather_icon_lbl = tk.Label(
+            frame,
+            image=self.images["current_icon"],
+            bg="#174384",
+        )
+        cr_weather_icon_lbl.place(
+            x=2,
+            y=35,
+        )
+        cr_temp_text = tk.Label(
+            frame,
+            text=str(int(get_data["temp"])) + "°",
+            bg="#174384",
+            fg="#fefefe",
+            font=("Roboto Regular", 40),
+        )
+        cr_temp_text.place(
+            x=95,
+            y=55,
+        )
+        main_weather = tk.Label(
+            frame,
+            text=get_data["weather"],
+            bg="#174384",
+            fg="#fefefe",
+            font=("Roboto Black", 12),
+        )
+        main_weather.place(
+            x=199,
+            y=65,
+        )
+
+        feels_like = tk.Label(
+            frame,
+            text=f"feels like  {feels_like_temp}°",
+            bg="#174384",
+            fg="#fefefe",
+            font=("Roboto Regular", 10),
+        )
+        feels_like.place(
+            x=199,
+            y=90,
+        )
+        description = tk.Label(
+            frame,
+            text=get_data["description"]
+            + ". The high will be "
+            + str(int(get_data["temp_max"]))
+            + "°",
+            bg="#174384",
+            fg="#fefefe",
+            font=("Roboto Regular", 10),
+        )
+        description.place(
+            x=10,
+            y=128,
+        )
+
+        wind_speed = tk.Label(
+            frame,
+            text=f"Wind\n {int(wind)} km/h",
+            bg="#174384",
+            fg="#fefefe",
+            font=("Roboto Regular", 10),
+        )
+        wind_speed.place(
+            x=10,
+            y=165,
+        )
+        humidity = tk.Label(
+            frame,
+            text=f"Humidity\n {get_data['humidity']}%",
+            bg="#174384",
+            fg="#fefefe",
+            font=("Roboto Regular", 10),
+        )
+        humidity.place(
+            x=90,
+            y=165,
+        )
+        visibility = tk.Label(
+            frame,
+            text=f"Visibility\n {vis / 1000:.0f} km",
+            bg="#174384",
+            fg="#fefefe",
+            font=("Roboto Regular", 10),
+        )
+        visibility.place(
+            x=170,
+            y=165,
+        )
+        pressure = tk.Label(
+            frame,
+            text=f"Pressure\n {int(get_data['pressure'])} mb",
+            bg="#174384",
+            fg="#fefefe",
+            font=("Roboto Regular", 10),
+        )
+        pressure.place(
+            x=250,
+            y=165,
+        )
+
+    def set_daily_weather(
+        self,
+        get_data: dict | None,
+        future_data: list,
+    ):
+        """Set daily weather, without the box of today if get_data is None."""
+        # SET FRAME
+        frame = tk.Frame(
+            self.root,
+            width=980,
+            height=140,
+            bg="#204c8a",
+        )
+        frame.place(
+            x=40,
+            y=310,
+        )
+        # LABEL TITLE
+        title_lbl = tk.Label(
+            frame,
+            fg="#fefefe",
+            bg="#204c8a",
+            font=("Roboto Bold", 10),
+            text="5 DAY FORECAST",
+        )
+        title_lbl.place(
+            x=0,
+            y=0,
+        )
+
+        def current_weather_box(frame_bg):
+            # BOX CURRENT
+            box_cr = tk.Frame(
+                frame_bg,
+                bg="#204c8a",
+            )
+            box_cr.place(
+                x=0,
+                y=25,
+                width=230,
+                height=120,
+            )
+            bg_box_cr = tk.Label(
+                box_cr,
+                bg="#204c8a",
+                image=self.images["cr_w_bg"],
+                border=0,
+            )
+            bg_box_cr.place(
+                x=0,
+                y=0,
+            )
+
+            date_lbl_one = tk.Label(
+                box_cr,
+                fg="#fefefe",
+                font=("Roboto Regular", 9),
+                text="Today",
+                bg="#315793",
+            )
+            date_lbl_one.place(
+                x=10,
+                y=5,
+            )
+            self.images["cr_resized_image"] = self.load_image(
+                get_data["icon"],
+                60,
+                60,
+            )
+            icon_lbl_one = tk.Label(
+                box_cr,
+                image=self.images["cr_resized_image"],
+                bg="#315793",
+            )
+            icon_lbl_one.place(
+                x=8,
+                y=25,
+                width=60,
+                height=60,
+            )
+            temp_lbl_one = tk.Label(
+                box_cr,
+                fg="#fefefe",
+                font=("Roboto Bold", 9),
+                text=f"{get_data['temp_max']:.0f}°",
+                bg="#315793",
+            )
+            temp_lbl_one.place(
+                x=75,
+                y=32,
+            )
+            humidity_lbl_one = tk.Label(
+                box_cr,
+                fg="#fefefe",
+                font=("Roboto Bold", 9),
+                text=f"{get_data['humidity']}%",
+                bg="#315793",
+            )
+            humidity_lbl_one.place(
+                x=75,
+                y=55,
+            )
+            weather_lbl_one = tk.Label(
+                box_cr,
+                fg="#fefefe",
+                font=("Roboto Bold", 10),
+                text=f"{get_data['weather']}",
+                bg="#315793",
+            )
+            weather_lbl_one.place(
+                x=125,
+                y=41,
+            )
+
+        if get_data:
+            current_weather_box(frame)
+        # SHOW OTHER DAYS WEATHER
+        x_box = 240
+        for weather in future_data:
+            box_future = tk.Frame(
+                frame,
+                bg="#204c8a",
+                width=120,
+                height=118,
+            )
+            box_future.place(
+                x=x_box,
+                y=25,
+            )
+            box_future_bg = tk.Label(
+                box_future,
+                bg="#204c8a",
+                image=self.images["other_w_bg"],
+                border=0,
+            )
+            box_future_bg.pack()
+
+            date_lbl_one = tk.Label(
+                box_future,
+                fg="#fefefe",
+                font=("Roboto Regular", 9),
+                text=weather["date"],
+                bg="#315793",
+            )
+            date_lbl_one.place(
+                x=10,
+                y=5,
+            )
+            self.images["fu_resized_img" + str(x_box)] = self.load_image(
+                weather["icon"],
+                60,
+                60,
+            )
+            icon_lbl_one = tk.Label(
+                box_future,
+                image=self.images["fu_resized_img" + str(x_box)],
+                bg="#315793",
+            )
+            icon_lbl_one.place(
+                x=8,
+                y=25,
+                width=60,
+                height=60,
+            )
+            temp_lbl_one = tk.Label(
+                box_future,
+                fg="#fefefe",
+                font=("Roboto Bold", 9),
+                text=f"{weather['temp']:.0f}°",
+                bg="#315793",
+            )
+            temp_lbl_one.place(
+                x=75,
+                y=32,
+            )
+            humidity_lbl_one = tk.Label(
+                box_future,
+                fg="#fefefe",
+                font=("Roboto Bold", 9),
+                text=f"{weather['humidity']}%",
+                bg="#315793",
+            )
+            humidity_lbl_one.place(
+                x=75,
+                y=55,
+            )
+            x_box += 130
+
+    def set_hourly_weather(
+        self,
+        hourly_data: list,
+    ):
+        """Set hourly forecast."""
+        frame_hou = tk.Frame(
+            self.root,
+            width=980,
+            height=150,
+            bg="#204c8a",
+        )
+        frame_hou.place(
+            x=40,
+            y=450,
+        )
+        # LABEL TITLE
+        title_lbl_hou = tk.Label(
+            frame_hou,
+            fg="#fefefe",
+            bg="#204c8a",
+            font=("Roboto Bold", 10),
+            text="HOURLY FORECAST",
+        )
+        title_lbl_hou.place(
+            x=0,
+            y=0,
+        )
+
+        # SHOW OTHER DAYS WEATHER
+        count = 0
+        for num, weather_hou in enumerate(hourly_data):
+            if num == 0:
+                continue
+            box_future_hou = tk.Frame(
+                frame_hou,
+                bg="#204c8a",
+                width=120,
+                height=118,
+            )
+            box_future_hou.place(
+                x=count,
+                y=25,
+            )
+            box_future_bg_hou = tk.Label(
+                box_future_hou,
+                bg="#204c8a",
+                image=self.images["other_w_bg"],
+                border=0,
+            )
+            box_future_bg_hou.pack()
+
+            date_lbl_one_hou = tk.Label(
+                box_future_hou,
+                fg="#fefefe",
+                font=("Roboto Regular", 9),
+                text=f"{weather_hou['hour']}",
+                bg="#315793",
+            )
+            date_lbl_one_hou.place(
+                x=10,
+                y=5,
+            )
+            self.images["ico_resize" + str(count)] = self.load_image(
+                weather_hou["icon"],
+                60,
+                60,
+            )
+            icon_lbl_one_hou = tk.Label(
+                box_future_hou,
+                image=self.images["ico_resize" + str(count)],
+                bg="#315793",
+            )
+            icon_lbl_one_hou.place(
+                x=8,
+                y=25,
+                width=60,
+                height=60,
+            )
+            temp_lbl_one_hou = tk.Label(
+                box_future_hou,
+                fg="#fefefe",
+                font=("Roboto Bold", 9),
+                text=f"{weather_hou['temp']:.0f}°",
+                bg="#315793",
+            )
+            temp_lbl_one_hou.place(
+                x=75,
+                y=32,
+            )
+            humidity_lbl_one_hou = tk.Label(
+                box_future_hou,
+                fg="#fefefe",
+                font=("Roboto Bold", 9),
+                text=f"{weather_hou['humidity']}%",
+                bg="#315793",
+            )
+            humidity_lbl_one_hou.place(
+                x=75,
+                y=55,
+            )
+            count += 130
+
+    def set_chart(self, hourly_data: list, history=None):
+        """Set temperature chart, with archived weather if history is given."""
+        # CHART FRAME
+        frame_ne = tk.Frame(
+            self.root,
+            width=400,
+            height=310,
+            bg="#204c8a",
+        )
+        frame_ne.place(
+            x=540,
+            y=70,
+        )
+
+        def chart():
+            figure = new_chart_figure()
+            draw_temperature_chart(figure, hourly_data, history)
+
+            # DISPLAY CHART
+            canvas = FigureCanvasTkAgg(figure, master=frame_ne)
+            canvas.get_tk_widget().pack()
+
+        chart()
+
+    @staticmethod
+    def load_image(img_name, width=None, height=None, resize=True):
+        """Load images and resize."""
+        image = Image.open(img_path + img_name + ".png")
+        if resize and (width is not None or height is not None):
+            image = image.resize((width, height), Image.Resampling.LANCZOS)
+        return ImageTk.PhotoImage(image)
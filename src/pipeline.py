@@ -0,0 +1,146 @@
+"""Fetch the data of every panel of a search under one deadline."""
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from geopy.exc import GeopyError  # type: ignore
+
+# ERRORS OF A FAILED FETCH (REQUESTS ERRORS ARE OSERROR, BAD JSON VALUEERROR)
+FETCH_ERRORS = (
+    OSError,
+    ValueError,
+    KeyError,
+    TypeError,
+    AttributeError,
+    GeopyError,
+)
+
+
+class SearchPipeline:
+    """Run the fetches of a search concurrently and collect what arrives.
+
+    connect(deadline) builds the object every source is called with, for
+    example WeatherData, and sources maps a name to a function of it. A
+    failed source gives None. After the deadline nothing is waited for,
+    but late results are still collected so they can be cached.
+    """
+
+    def __init__(self, connect, sources: dict, budget: float):
+        """Initialize class SearchPipeline."""
+        self.deadline = time.monotonic() + budget
+        self.names = list(sources)
+        self.__results: queue.Queue = queue.Queue()
+        self.__resolved = 0
+        threading.Thread(
+            target=self.__run,
+            args=(connect, sources),
+            daemon=True,
+        ).start()
+
+    def expired(self) -> bool:
+        """Check if the deadline passed."""
+        return time.monotonic() >= self.deadline
+
+    def done(self) -> bool:
+        """Check if every source gave data or failed."""
+        return self.__resolved == len(self.names)
+
+    def ready(self) -> list:
+        """Get (name, data) of the sources resolved since the last call."""
+        results = []
+        while not self.__results.empty():
+            results.append(self.__results.get())
+        self.__resolved += len(results)
+        return results
+
+    def __run(self, connect, sources: dict):
+        """Connect once, then call every source on its own thread."""
+        source = None
+        try:
+            source = connect(self.deadline)
+        except FETCH_ERRORS:
+            pass
+        finally:
+            # ANY ERROR STILL RESOLVES EVERY SOURCE, OR done() NEVER GETS TRUE
+            if source is None:
+                for name in sources:
+                    self.__results.put((name, None))
+        if source is None:
+            return
+        executor = ThreadPoolExecutor(max_workers=len(sources))
+        for name, fetch in sources.items():
+            executor.submit(self.__fetch, name, fetch, source)
+        executor.shutdown(wait=False)
+
+    def __fetch(self, name: str, fetch, source):
+        """Put result of one source, None when it failed."""
+        data = None
+        try:
+            data = fetch(source)
+        except FETCH_ERRORS:
+            pass
+        finally:
+            self.__results.put((name, data))
+
+
+class SearchView:
+    """Decide what each panel of a search draws as its data arrives.
+
+    Data that failed or missed the deadline is replaced by the last data
+    of the city in cache, or by a placeholder. Late data is only kept in
+    cache for the next search. Every draw is a tuple of the panel name
+    and the arguments of its drawing function.
+    """
+
+    def __init__(self, names: list, cache: dict, placeholders: dict):
+        """Initialize class SearchView."""
+        self.names = names
+        self.cache = cache
+        self.placeholders = placeholders
+        self.shown: dict = {}
+
+    def arrived(self, results: list, expired: bool) -> list:
+        """Get draws of results, only cached once the search expired."""
+        draws = []
+        for name, data in results:
+            if data is not None:
+                self.cache[name] = data
+            if not expired and name not in self.shown:
+                draws += self.__show(name, data)
+        return draws
+
+    def fill(self) -> list:
+        """Get draws of cached or placeholder data of panels without data."""
+        draws = []
+        for name in self.names:
+            if self.shown.get(name) is None:
+                data = self.cache.get(name, self.placeholders[name])
+                draws += self.__show(name, data)
+        return draws
+
+    def __show(self, name: str, data) -> list:
+        """Get draws of the panels that need data of name.
+
+        A failed source (None) draws nothing until fill, except the daily
+        panel which is drawn without the box of today.
+        """
+        self.shown[name] = data
+        draws: list = []
+        current = self.shown.get("current")
+        future = self.shown.get("future")
+        if name in ("current", "future") and (current, future) != (None, None):
+            if "current" in self.shown and "future" in self.shown:
+                draws.append(("daily", current, future or []))
+        if data is None:
+            return draws
+        if name in ("city", "current"):
+            draws.append((name, data))
+        elif name == "hourly":
+            draws.append(("hourly", data))
+            draws.append(("chart", data, self.shown.get("history")))
+        elif name == "history" and data.get("observed"):
+            # WITHOUT OBSERVATIONS THE CHART OF THE HOURLY DATA IS THE SAME
+            if self.shown.get("hourly") is not None:
+                draws.append(("chart", self.shown["hourly"], data))
+        return draws
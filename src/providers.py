@@ -0,0 +1,139 @@
+"""Map responses of the OpenWeather endpoints to the records the app uses."""
+from datetime import datetime
+
+ONE_CALL_URL = "https://api.openweathermap.org/data/3.0/onecall?"
+
+
+def hour_label(hour: int) -> str:
+    """Format hour of the day like 3 PM."""
+    hour_data = {
+        "hour": hour if hour <= 12 else hour - 12 if hour > 12 else 12,
+        "am_pm": "AM" if hour < 12 else "PM",
+    }
+    return f"{hour_data['hour']} {hour_data['am_pm']}"
+
+
+def day_label(date_time: datetime) -> str:
+    """Format date like Thu 02."""
+    days_of_the_week = date_time.strftime("%a")
+    days_of_the_month = date_time.strftime("%d")
+    return days_of_the_week + " " + days_of_the_month
+
+
+def weather_current(json: dict) -> dict:
+    """Get current weather data of a /weather response."""
+    return {
+        "weather": json["weather"][0]["main"],
+        "description": json["weather"][0]["description"],
+        "icon": json["weather"][0]["icon"],
+        "temp": json["main"]["temp"],
+        "feels_like": json["main"]["feels_like"],
+        "temp_min": json["main"]["temp_min"],
+        "temp_max": json["main"]["temp_max"],
+        "pressure": json["main"]["pressure"],
+        "humidity": json["main"]["humidity"],
+        "wind": json["wind"]["speed"],
+        "visibility": json["visibility"],
+    }
+
+
+def forecast_daily(records: list, after: datetime) -> list:
+    """Get the noon slot of every day after after from forecast records."""
+    daily_list = []
+    for weather in records:
+        date_time = datetime.utcfromtimestamp(weather.dt)
+        if date_time.hour == 12 and date_time > after:
+            daily_list.append(
+                {
+                    "date": day_label(date_time),
+                    "temp": weather.temp,
+                    "humidity": weather.humidity,
+                    "icon": weather.icon,
+                },
+            )
+    return daily_list
+
+
+def forecast_hourly(records: list, date: str) -> list:
+    """Get 3-hour slots of date (YYYY-MM-DD, UTC) from forecast records."""
+    hourly_list = []
+    for weather in records:
+        date_time = datetime.utcfromtimestamp(weather.dt)
+        if date_time.strftime("%Y-%m-%d") == date:
+            hourly_list.append(
+                {
+                    "dt": weather.dt,
+                    "hour": hour_label(date_time.hour),
+                    "temp": weather.temp,
+                    "humidity": weather.humidity,
+                    "icon": weather.icon,
+                },
+            )
+    return hourly_list
+
+
+def one_call_current(json: dict) -> dict:
+    """Get current weather data like weather_current."""
+    current = json["current"]
+    today = json["daily"][0]
+    return {
+        "weather": current["weather"][0]["main"],
+        "description": current["weather"][0]["description"],
+        "icon": current["weather"][0]["icon"],
+        "temp": current["temp"],
+        "feels_like": current["feels_like"],
+        "temp_min": today["temp"]["min"],
+        "temp_max": today["temp"]["max"],
+        "pressure": current["pressure"],
+        "humidity": current["humidity"],
+        "wind": current["wind_speed"],
+        "visibility": current.get("visibility", 10000),
+    }
+
+
+def one_call_daily(json: dict, days: int = 5) -> list:
+    """Get future weather data like forecast_daily."""
+    daily_list = []
+    for weather in json["daily"][1:][:days]:
+        local_time = weather["dt"] + json.get("timezone_offset", 0)
+        daily_list.append(
+            {
+                "date": day_label(datetime.utcfromtimestamp(local_time)),
+                "temp": weather["temp"]["day"],
+                "humidity": weather["humidity"],
+                "icon": weather["weather"][0]["icon"],
+            },
+        )
+    return daily_list
+
+
+def one_call_hourly(json: dict, date: str) -> list:
+    """Get 3-hour slots of date (YYYY-MM-DD, UTC) like forecast_hourly."""
+    hourly_list = []
+    for weather in json["hourly"]:
+        date_time = datetime.utcfromtimestamp(weather["dt"])
+        if date_time.strftime("%Y-%m-%d") != date or date_time.hour % 3:
+            continue
+        hourly_list.append(
+            {
+                "dt": weather["dt"],
+                "hour": hour_label(date_time.hour),
+                "temp": weather["temp"],
+                "humidity": weather["humidity"],
+                "icon": weather["weather"][0]["icon"],
+            },
+        )
+    return hourly_list
+
+
+def one_call_samples(json: dict) -> list:
+    """Get (valid, temp, humidity, icon) of every hour for the archive."""
+    return [
+        (
+            weather["dt"],
+            weather["temp"],
+            weather["humidity"],
+            weather["weather"][0]["icon"],
+        )
+        for weather in json["hourly"]
+    ]
@@ -0,0 +1,243 @@
+"""Token bucket rate limits for the upstream APIs."""
+import heapq
+import itertools
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+# PRIORITY OF REQUESTS, LOWER GOES FIRST
+INTERACTIVE = 0
+BACKGROUND = 1
+
+
+def _refill(tokens: float, updated: float, limit: tuple, now: float) -> float:
+    """Get tokens of a bucket after refilling it since updated."""
+    count, period = limit
+    return min(count, tokens + (now - updated) * count / period)
+
+
+def _take(buckets: list, limits: list) -> float:
+    """Take one token of every bucket, or get seconds until possible.
+
+    buckets holds the refilled tokens of each limit and is changed in place.
+    """
+    wait = 0.0
+    for tokens, (count, period) in zip(buckets, limits):
+        if tokens < 1:
+            wait = max(wait, (1 - tokens) * period / count)
+    if wait == 0:
+        for num, _ in enumerate(buckets):
+            buckets[num] -= 1
+    return wait
+
+
+class MemoryStore:
+    """Keep buckets in memory, shared by the threads of one process."""
+
+    def __init__(self):
+        """Initialize class MemoryStore."""
+        self.__lock = threading.Lock()
+        self.__buckets: dict = {}
+
+    def take(self, name: str, limits: list, now: float, _timeout=None):
+        """Take a token of every limit of name, or get seconds to wait.
+
+        The lock is only held to update the buckets, so there is no timeout.
+        """
+        with self.__lock:
+            buckets = self.__load(name, limits, now)
+            wait = _take(buckets, limits)
+            self.__buckets[name] = (buckets, now)
+        return wait
+
+    def remaining(self, name: str, limits: list, now: float) -> list:
+        """Get tokens left of every limit of name."""
+        with self.__lock:
+            return self.__load(name, limits, now)
+
+    def __load(self, name: str, limits: list, now: float) -> list:
+        """Get refilled tokens of name, full for a new name."""
+        if name not in self.__buckets:
+            return [float(count) for count, _ in limits]
+        buckets, updated = self.__buckets[name]
+        return [
+            _refill(tokens, updated, limit, now)
+            for tokens, limit in zip(buckets, limits)
+        ]
+
+
+class SqliteStore:
+    """Keep buckets in a SQLite file, shared by every process using it."""
+
+    def __init__(self, file_path: str):
+        """Initialize class SqliteStore."""
+        self.file_path = file_path
+        with closing(self.__connect()) as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS buckets ("
+                "name TEXT, period REAL, tokens REAL, updated REAL, "
+                "PRIMARY KEY (name, period))",
+            )
+
+    def take(self, name: str, limits: list, now: float, timeout=None):
+        """Take a token of every limit of name, or get seconds to wait.
+
+        Raise TimeoutError if another process holds the file for longer
+        than timeout seconds.
+        """
+        with closing(self.__connect(timeout)) as connection:
+            # LOCK THE FILE UNTIL THE NEW TOKENS ARE WRITTEN
+            try:
+                connection.execute("BEGIN IMMEDIATE")
+            except sqlite3.OperationalError as error:
+                if "locked" not in str(error):
+                    raise
+                raise TimeoutError(f"{self.file_path} is locked") from error
+            buckets = self.__load(connection, name, limits, now)
+            wait = _take(buckets, limits)
+            connection.executemany(
+                "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?, ?)",
+                [
+                    (name, period, tokens, now)
+                    for tokens, (_, period) in zip(buckets, limits)
+                ],
+            )
+            connection.execute("COMMIT")
+        return wait
+
+    def remaining(self, name: str, limits: list, now: float) -> list:
+        """Get tokens left of every limit of name."""
+        with closing(self.__connect()) as connection:
+            return self.__load(connection, name, limits, now)
+
+    def __connect(self, timeout=None) -> sqlite3.Connection:
+        """Open the file, waiting for other processes to release it."""
+        return sqlite3.connect(
+            self.file_path,
+            timeout=30 if timeout is None else min(30, timeout),
+            isolation_level=None,
+        )
+
+    @staticmethod
+    def __load(connection, name: str, limits: list, now: float) -> list:
+        """Get refilled tokens of name, full for a new name."""
+        rows = {
+            period: (tokens, updated)
+            for period, tokens, updated in connection.execute(
+                "SELECT period, tokens, updated FROM buckets WHERE name = ?",
+                (name,),
+            )
+        }
+        buckets = []
+        for count, period in limits:
+            if period in rows:
+                tokens, updated = rows[period]
+                buckets.append(_refill(tokens, updated, (count, period), now))
+            else:
+                buckets.append(float(count))
+        return buckets
+
+
+class RateLimiter:
+    """Limit requests to one upstream with token buckets.
+
+    limits is a list of (count, period in seconds); a request needs a
+    token of every limit. Waiting threads are served by priority, then in
+    arrival order. Across processes sharing a SqliteStore the limits hold,
+    but priority only orders the threads of each process.
+    """
+
+    def __init__(self, name: str, limits: list, store=None):
+        """Initialize class RateLimiter."""
+        self.name = name
+        self.limits = limits
+        self.store = store if store is not None else MemoryStore()
+        self.__condition = threading.Condition()
+        self.__waiting: list = []
+        self.__tickets = itertools.count()
+        self.__counts = {"granted": 0, "timed_out": 0}
+
+    def acquire(self, priority: int = INTERACTIVE, timeout=None) -> bool:
+        """Wait for a token, return False if timeout seconds passed first."""
+        ticket = (priority, next(self.__tickets))
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.__condition:
+            heapq.heappush(self.__waiting, ticket)
+        try:
+            wait = 0.0
+            while True:
+                if not self.__wait_turn(ticket, deadline, wait):
+                    break
+                left = None
+                if deadline is not None:
+                    left = max(0.0, deadline - time.monotonic())
+                try:
+                    # THE STORE MAY WAIT FOR A FILE LOCK, THE QUEUE MUST NOT
+                    wait = self.store.take(
+                        self.name,
+                        self.limits,
+                        time.time(),
+                        left,
+                    )
+                except TimeoutError:
+                    break
+                if wait == 0:
+                    with self.__condition:
+                        self.__counts["granted"] += 1
+                    return True
+            with self.__condition:
+                self.__counts["timed_out"] += 1
+            return False
+        finally:
+            with self.__condition:
+                self.__waiting.remove(ticket)
+                heapq.heapify(self.__waiting)
+                self.__condition.notify_all()
+
+    def metrics(self) -> dict:
+        """Get tokens left of every limit and counts of requests."""
+        remaining = self.store.remaining(self.name, self.limits, time.time())
+        with self.__condition:
+            return {
+                "remaining": {
+                    f"{count}/{period}s": int(tokens)
+                    for tokens, (count, period) in zip(remaining, self.limits)
+                },
+                "waiting": len(self.__waiting),
+                **self.__counts,
+            }
+
+    def __wait_turn(self, ticket: tuple, deadline, wait: float) -> bool:
+        """Wait until ticket is first and wait seconds passed.
+
+        Return False if the deadline passed first.
+        """
+        with self.__condition:
+            while True:
+                first = self.__waiting[0] == ticket
+                if first and wait <= 0:
+                    return True
+                sleep = wait if first else None
+                if deadline is not None:
+                    left = deadline - time.monotonic()
+                    if left <= 0:
+                        return False
+                    sleep = left if sleep is None else min(sleep, left)
+                start = time.monotonic()
+                self.__condition.wait(sleep)
+                wait -= time.monotonic() - start
+
+
+def open_store(file_path: str):
+    """Get a SqliteStore of file_path, a MemoryStore if it is empty.
+
+    A file that cannot be opened also gives a MemoryStore, so the app
+    still runs with the limits held within the process.
+    """
+    if file_path:
+        try:
+            return SqliteStore(file_path)
+        except sqlite3.Error:
+            pass
+    return MemoryStore()
@@ -0,0 +1,179 @@
+"""Render chart and daily panel images without opening the app."""
+import argparse
+import json
+from concurrent.futures import ProcessPoolExecutor
+from os import makedirs, path
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image, ImageDraw, ImageFont
+
+import charts
+
+# IMAGE PATH
+img_path = path.join(path.dirname(path.abspath(__file__)), "assets", "images")
+
+# FONTS OF THE APP WITH THEIR TRUETYPE FILE, SIZES ARE IN POINTS LIKE TK
+FONT_FILES = {
+    "Roboto Regular": "Roboto-Regular.ttf",
+    "Roboto Bold": "Roboto-Bold.ttf",
+}
+SCREEN_DPI = 96
+
+# FIGURE OF THE WORKER PROCESS, DRAWN AGAIN FOR EVERY CITY
+_worker: dict = {}
+
+
+def _init_worker():
+    """Create the figure once in each worker process."""
+    figure = charts.new_chart_figure()
+    FigureCanvasAgg(figure)
+    _worker["figure"] = figure
+    _worker["images"] = {}
+    _worker["fonts"] = {}
+
+
+def _load_image(img_name: str, width=None, height=None) -> Image.Image:
+    """Load images once per worker and resize."""
+    key = (img_name, width, height)
+    if key not in _worker["images"]:
+        image = Image.open(path.join(img_path, img_name + ".png"))
+        image = image.convert("RGBA")
+        if width is not None and height is not None:
+            image = image.resize((width, height), Image.Resampling.LANCZOS)
+        _worker["images"][key] = image
+    return _worker["images"][key]
+
+
+def _font(family: str, size: int):
+    """Load font of the app, the default font if it is not installed."""
+    key = (family, size)
+    fonts = _worker["fonts"]
+    if key not in fonts:
+        try:
+            fonts[key] = ImageFont.truetype(
+                FONT_FILES[family],
+                round(size * SCREEN_DPI / 72),
+            )
+        except OSError:
+            fonts[key] = ImageFont.load_default()
+    return fonts[key]
+
+
+def daily_card(get_data: dict, future_data: list) -> Image.Image:
+    """Draw the 5 day forecast panel of the app as an image."""
+    card = Image.new(
+        "RGBA",
+        (240 + 130 * len(future_data) - 10, 120),
+        charts.BG_COLOR,
+    )
+    draw = ImageDraw.Draw(card)
+    regular = _font("Roboto Regular", 9)
+    bold = _font("Roboto Bold", 9)
+    title = _font("Roboto Bold", 10)
+    draw.text((0, 5), "5 DAY FORECAST", fill=charts.TEXT_COLOR, font=title)
+
+    # BOX CURRENT
+    background = _load_image("cr_w_bg")
+    card.paste(background, (0, 25), background)
+    icon = _load_image(get_data["icon"], 60, 60)
+    card.paste(icon, (8, 50), icon)
+    draw.text((10, 30), "Today", fill=charts.TEXT_COLOR, font=regular)
+    draw.text(
+        (75, 57),
+        f"{get_data['temp_max']:.0f}°",
+        fill=charts.TEXT_COLOR,
+        font=bold,
+    )
+    draw.text(
+        (75, 80),
+        f"{get_data['humidity']}%",
+        fill=charts.TEXT_COLOR,
+        font=bold,
+    )
+    draw.text(
+        (125, 66),
+        f"{get_data['weather']}",
+        fill=charts.TEXT_COLOR,
+        font=title,
+    )
+
+    # OTHER DAYS WEATHER
+    x_box = 240
+    for weather in future_data:
+        background = _load_image("other_w_bg")
+        card.paste(background, (x_box, 25), background)
+        icon = _load_image(weather["icon"], 60, 60)
+        card.paste(icon, (x_box + 8, 50), icon)
+        draw.text(
+            (x_box + 10, 30),
+            weather["date"],
+            fill=charts.TEXT_COLOR,
+            font=regular,
+        )
+        draw.text(
+            (x_box + 75, 57),
+            f"{weather['temp']:.0f}°",
+            fill=charts.TEXT_COLOR,
+            font=bold,
+        )
+        draw.text(
+            (x_box + 75, 80),
+            f"{weather['humidity']}%",
+            fill=charts.TEXT_COLOR,
+            font=bold,
+        )
+        x_box += 130
+    return card
+
+
+def _render_city(job: dict, out_dir: str) -> dict:
+    """Save chart and daily panel of one city."""
+    name = job["city"].replace(path.sep, "_")
+    chart_path = path.join(out_dir, f"{name}_chart.png")
+    card_path = path.join(out_dir, f"{name}_daily.png")
+
+    figure = _worker["figure"]
+    charts.draw_temperature_chart(figure, job["hourly"], job.get("history"))
+    figure.savefig(chart_path, facecolor=figure.get_facecolor())
+
+    daily_card(job["current"], job["daily"]).save(card_path)
+    return {
+        "city": job["city"],
+        "chart": chart_path,
+        "daily": card_path,
+    }
+
+
+def render_batch(jobs: list, out_dir: str, max_workers=None) -> list:
+    """Render images of many cities on all cores.
+
+    Every job is a dict with ``city``, ``current`` (WeatherData.current_data),
+    ``daily`` (future_data) and ``hourly`` (hourly_data), and optionally
+    ``history`` (WeatherData.chart_history).
+    """
+    makedirs(out_dir, exist_ok=True)
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+    ) as executor:
+        return list(
+            executor.map(
+                _render_city,
+                jobs,
+                [out_dir] * len(jobs),
+                chunksize=max(1, len(jobs) // 64),
+            ),
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=render_batch.__doc__)
+    parser.add_argument("jobs", help="JSON file with a list of jobs")
+    parser.add_argument("out_dir", help="directory for the images")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    with open(args.jobs, encoding="utf-8") as jobs_file:
+        batch = json.load(jobs_file)
+    results = render_batch(batch, args.out_dir, args.workers)
+    for result in results:
+        print(result["chart"], result["daily"])
@@ -0,0 +1,25 @@
+"""Make the modules of src importable and share fixtures of the tests."""
+import io
+import sys
+from os import path
+
+import pytest
+import requests
+
+sys.path.insert(
+    0,
+    path.join(path.dirname(path.dirname(path.abspath(__file__))), "src"),
+)
+
+
+@pytest.fixture(name="make_response")
+def fixture_make_response():
+    """Get a function building a requests response of a given body."""
+
+    def make_response(content: bytes, status: int = 200):
+        res = requests.Response()
+        res.status_code = status
+        res.raw = io.BytesIO(content)
+        return res
+
+    return make_response
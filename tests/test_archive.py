@@ -0,0 +1,63 @@
+"""Tests of the forecast archive."""
+import time
+
+from archive import FORECAST, FORECAST_HORIZON, OBSERVATION, ForecastArchive
+
+
+def test_issued_between_is_a_view_of_the_file(tmp_path):
+    """Range queries slice the memory map without copying."""
+    archive = ForecastArchive(str(tmp_path), 1.0, 2.0)
+    archive.append_observation(100, 10.5, 50, "01d")
+    records = archive.issued_between(0, int(time.time()) + 1)
+    assert len(records) == 1
+    assert records.base is not None
+    assert records["kind"][0] == OBSERVATION
+    assert records["icon"][0] == b"01d"
+
+
+def test_forecasts_keep_latest_issued_per_time(tmp_path):
+    """A newer forecast of the same time replaces the older one."""
+    archive = ForecastArchive(str(tmp_path), 1.0, 2.0)
+    now = int(time.time())
+    archive.append_forecast(
+        [(now + 3600, 1.0, 40, "02d"), (now + 7200, 2.0, 40, "02d")],
+    )
+    archive.append_forecast([(now + 7200, 3.0, 45, "03d")])
+    records = archive.forecasts(now, now + 10800)
+    assert records["valid"].tolist() == [now + 3600, now + 7200]
+    assert records["temp"].tolist() == [1.0, 3.0]
+    assert set(records["kind"].tolist()) == {FORECAST}
+
+
+def test_history_pairs_observations_with_forecasts(tmp_path):
+    """History gives (valid, temp) pairs of both kinds for the chart."""
+    archive = ForecastArchive(str(tmp_path), 1.0, 2.0)
+    now = int(time.time())
+    archive.append_forecast([(now - 3600, 9.0, 40, "02d")])
+    archive.append_observation(now - 3600, 10.5, 50, "01d")
+    assert archive.history(now - 7200, now) == {
+        "observed": [(now - 3600, 10.5)],
+        "forecast": [(now - 3600, 9.0)],
+    }
+
+
+def test_prune_drops_old_records(tmp_path):
+    """Records fetched before the cut are removed from the file."""
+    archive = ForecastArchive(str(tmp_path), 1.0, 2.0)
+    archive.append_observation(100, 10.5, 50, "01d")
+    archive.prune(int(time.time()) + 10)
+    assert len(archive.records()) == 0
+    archive.append_observation(200, 11.0, 50, "01d")
+    assert archive.records()["valid"].tolist() == [200]
+
+
+def test_forecasts_skip_records_issued_out_of_horizon(tmp_path):
+    """Forecasts fetched too long before the range are not scanned."""
+    archive = ForecastArchive(str(tmp_path), 1.0, 2.0)
+    now = int(time.time())
+    # VALID IN THE RANGE, BUT NOT A FORECAST ANY FETCH COULD HAVE GIVEN
+    archive.append_forecast([(now + FORECAST_HORIZON * 2, 1.0, 40, "02d")])
+    archive.append_forecast([(now + 3600, 2.0, 40, "02d")])
+    start = now + FORECAST_HORIZON * 2
+    assert len(archive.forecasts(start, start + 1)) == 0
+    assert archive.forecasts(now, now + 7200)["temp"].tolist() == [2.0]
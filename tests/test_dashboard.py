@@ -0,0 +1,56 @@
+"""Tests of the background fetch of the dashboard."""
+import time
+
+import pytest
+
+from dashboard import UNAVAILABLE, _Feed
+
+# THE UNEXPECTED ERROR IS RAISED IN THE FETCH THREAD
+THREAD_ERROR = "ignore::pytest.PytestUnhandledThreadExceptionWarning"
+
+
+class FakeWeather:  # pylint: disable=too-few-public-methods
+    """Weather of a city, failing for the city named Nowhere."""
+
+    def __init__(self, city: str):
+        """Initialize class FakeWeather."""
+        if city == "Nowhere":
+            raise AttributeError("no location found")
+        self.city = city
+
+    def current_data(self) -> dict:
+        """Get current weather data."""
+        if self.city == "Offline":
+            raise OSError("connection refused")
+        return {"temp": 10.0, "city": self.city}
+
+
+def fetch_all(feed: _Feed) -> list:
+    """Run one fetch of every location and get its results."""
+    feed.start()
+    while feed.fetching.is_set():
+        time.sleep(0.01)
+    return sorted(feed.ready(), key=lambda result: result[0])
+
+
+def test_failed_locations_are_unavailable():
+    """Every location gets a result, a failed one too."""
+    feed = _Feed(["Rome", "Nowhere", "Offline"], FakeWeather)
+    assert fetch_all(feed) == [
+        (0, {"temp": 10.0, "city": "Rome"}),
+        (1, UNAVAILABLE),
+        (2, UNAVAILABLE),
+    ]
+
+
+@pytest.mark.filterwarnings(THREAD_ERROR)
+def test_unexpected_error_does_not_stop_refresh():
+    """An error out of the fetch errors still lets the next fetch start."""
+
+    def broken(city):
+        raise RuntimeError(city)
+
+    feed = _Feed(["Rome"], broken)
+    assert fetch_all(feed) == [(0, UNAVAILABLE)]
+    feed.weather_data = FakeWeather
+    assert fetch_all(feed) == [(0, {"temp": 10.0, "city": "Rome"})]
@@ -0,0 +1,55 @@
+"""Tests of decoding the forecast response with and without ijson."""
+from pathlib import Path
+
+import pytest
+import requests
+
+import forecast_stream
+
+FORECAST = (Path(__file__).parent / "fixtures" / "forecast.json").read_bytes()
+ERROR_BODY = b'{"cod": 401, "message": "Invalid API key."}'
+DECODERS = ["ijson", "orjson", "json"]
+
+
+@pytest.fixture(name="decoder", params=DECODERS)
+def fixture_decoder(request, monkeypatch):
+    """Decode with ijson, or without it with orjson, or with neither."""
+    if request.param != "ijson":
+        monkeypatch.setattr(forecast_stream, "ijson", None)
+    if request.param == "json":
+        monkeypatch.setattr(forecast_stream, "orjson", None)
+    return request.param
+
+
+def test_every_decoder_gives_the_same_records(decoder, make_response):
+    """The streamed records are the fields of the whole document."""
+    records = forecast_stream.forecast_records(make_response(FORECAST))
+    assert len(records) == 40, decoder
+    assert records[0] == forecast_stream.ForecastRecord(
+        1792411200,
+        14.99,
+        72,
+        "03d",
+    )
+
+
+@pytest.mark.usefixtures("decoder")
+def test_error_body_raises(make_response):
+    """A body without a forecast list is an error, not an empty forecast."""
+    with pytest.raises(ValueError):
+        forecast_stream.forecast_records(make_response(ERROR_BODY))
+
+
+@pytest.mark.usefixtures("decoder")
+def test_truncated_body_raises(make_response):
+    """A body cut short raises ValueError with every decoder."""
+    truncated = FORECAST[: len(FORECAST) // 2]
+    with pytest.raises(ValueError):
+        forecast_stream.forecast_records(make_response(truncated))
+
+
+@pytest.mark.usefixtures("decoder")
+def test_error_status_raises(make_response):
+    """An error status raises before the body is decoded."""
+    with pytest.raises(requests.HTTPError):
+        forecast_stream.forecast_records(make_response(ERROR_BODY, 401))
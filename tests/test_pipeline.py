@@ -0,0 +1,237 @@
+"""Tests of the search pipeline with injected latency and failures.
+
+Slow sources wait for a gate the test opens, so the order of results does
+not depend on how fast the machine runs the threads.
+"""
+import threading
+import time
+
+import pytest
+
+from pipeline import SearchPipeline, SearchView
+
+# THE ERROR OF A FAILED CONNECT IS RAISED IN THE PIPELINE THREAD
+THREAD_ERROR = "ignore::pytest.PytestUnhandledThreadExceptionWarning"
+# LONGEST WAIT OF A TEST FOR THE PIPELINE THREADS (s)
+TIMEOUT = 5
+PLACEHOLDERS = {
+    "city": {"country": "Location not available"},
+    "current": {},
+    "hourly": [],
+    "future": [],
+    "history": {},
+}
+
+
+def gated(value):
+    """Get a source that answers value once its gate is set, and the gate."""
+    gate = threading.Event()
+
+    def fetch(_source):
+        gate.wait(TIMEOUT)
+        return value
+
+    return fetch, gate
+
+
+def answering(value):
+    """Get a source that answers value at once."""
+    return lambda _source: value
+
+
+def failing(error: Exception):
+    """Get a source that raises error."""
+
+    def fetch(_source):
+        raise error
+
+    return fetch
+
+
+def wait_until(condition):
+    """Wait until condition() is true."""
+    deadline = time.monotonic() + TIMEOUT
+    while not condition():
+        assert time.monotonic() < deadline, "condition never got true"
+        time.sleep(0.005)
+
+
+def next_ready(search: SearchPipeline) -> list:
+    """Wait for the next results of search."""
+    results: list = []
+    wait_until(lambda: results.extend(search.ready()) or results)
+    return results
+
+
+def test_results_arrive_as_each_source_answers():
+    """Each source is ready as soon as it answers, not after the slowest."""
+    sources = {
+        "slow": gated("slow data"),
+        "fast": gated("fast data"),
+        "medium": gated("medium data"),
+    }
+    search = SearchPipeline(
+        lambda deadline: "location",
+        {name: fetch for name, (fetch, _) in sources.items()},
+        budget=60,
+    )
+    for name in ("fast", "medium", "slow"):
+        assert not search.done()
+        sources[name][1].set()
+        assert next_ready(search) == [(name, f"{name} data")]
+    assert search.done()
+    assert not search.expired()
+
+
+def test_sources_get_connected_object():
+    """Sources are called with what connect returned."""
+    search = SearchPipeline(
+        lambda deadline: {"deadline": deadline},
+        {"echo": lambda source: source["deadline"]},
+        budget=60,
+    )
+    assert next_ready(search) == [("echo", search.deadline)]
+
+
+def test_failed_source_gives_none_and_others_still_arrive():
+    """A failed source gives None without holding back the others."""
+    fetch, gate = gated("data")
+    search = SearchPipeline(
+        lambda deadline: "location",
+        {"fail": failing(ConnectionError("injected")), "ok": fetch},
+        budget=60,
+    )
+    assert next_ready(search) == [("fail", None)]
+    gate.set()
+    assert next_ready(search) == [("ok", "data")]
+    assert search.done()
+
+
+def test_late_source_arrives_after_expiry():
+    """A source slower than the budget still arrives once expired."""
+    fetch, gate = gated("late data")
+    search = SearchPipeline(
+        lambda deadline: "location",
+        {"late": fetch},
+        budget=0.05,
+    )
+    wait_until(search.expired)
+    assert not search.done()
+    assert not search.ready()
+    gate.set()
+    assert next_ready(search) == [("late", "late data")]
+    assert search.done()
+
+
+def test_unexpected_error_still_resolves_source():
+    """An error outside FETCH_ERRORS still lets the search finish."""
+    search = SearchPipeline(
+        lambda deadline: "location",
+        {
+            "broken": failing(RuntimeError("injected")),
+            "ok": answering("data"),
+        },
+        budget=60,
+    )
+    results: list = []
+    wait_until(lambda: results.extend(search.ready()) or search.done())
+    assert sorted(results, key=str) == [("broken", None), ("ok", "data")]
+
+
+@pytest.mark.filterwarnings(THREAD_ERROR)
+def test_failed_connect_resolves_every_source():
+    """When connect fails every source gives None."""
+
+    def connect(_deadline):
+        raise RuntimeError("injected")
+
+    search = SearchPipeline(
+        connect,
+        {"current": answering("data"), "hourly": answering("data")},
+        budget=60,
+    )
+    results: list = []
+    wait_until(lambda: results.extend(search.ready()) or search.done())
+    assert sorted(results) == [("current", None), ("hourly", None)]
+
+
+def new_view(cache=None) -> SearchView:
+    """Get the view of a search of every panel of the app."""
+    return SearchView(
+        list(PLACEHOLDERS),
+        {} if cache is None else cache,
+        PLACEHOLDERS,
+    )
+
+
+def test_view_draws_panels_as_data_arrives():
+    """Panels are drawn once the data they need arrived."""
+    view = new_view()
+    history = {"observed": [(100, 9.0)], "forecast": []}
+    assert view.arrived([("current", {"temp": 9})], False) == [
+        ("current", {"temp": 9}),
+    ]
+    assert view.arrived([("future", [{"temp": 8}])], False) == [
+        ("daily", {"temp": 9}, [{"temp": 8}]),
+    ]
+    assert view.arrived([("hourly", [{"temp": 7}])], False) == [
+        ("hourly", [{"temp": 7}]),
+        ("chart", [{"temp": 7}], None),
+    ]
+    assert view.arrived([("history", history)], False) == [
+        ("chart", [{"temp": 7}], history),
+    ]
+
+
+def test_view_skips_history_without_observations():
+    """Empty history does not draw the chart a second time."""
+    view = new_view()
+    view.arrived([("hourly", [{"temp": 7}])], False)
+    empty = {"observed": [], "forecast": [(100, 9.0)]}
+    assert not view.arrived([("history", empty)], False)
+    assert all(draw[0] != "chart" for draw in view.fill())
+
+
+def test_view_draws_daily_without_today_when_current_failed():
+    """A failed current panel still lets the daily panel draw the days."""
+    view = new_view()
+    assert not view.arrived([("current", None)], False)
+    assert view.arrived([("future", [{"temp": 8}])], False) == [
+        ("daily", None, [{"temp": 8}]),
+    ]
+
+
+def test_view_fills_failed_and_late_panels_at_the_deadline():
+    """At the deadline cached data, else placeholders, are drawn."""
+    cache = {"city": {"city": "Rome, ", "state": "", "country": "Italy"}}
+    view = new_view(cache)
+    view.arrived(
+        [("current", {"temp": 9}), ("city", None), ("future", None)],
+        False,
+    )
+    draws = view.fill()
+    assert ("city", cache["city"]) in draws
+    assert ("daily", {"temp": 9}, []) in draws
+    assert ("hourly", []) in draws
+    assert ("current", {"temp": 9}) not in draws
+    # EVERY PANEL HAS DATA NOW, A LATER FILL DRAWS NOTHING
+    assert not view.fill()
+
+
+def test_view_only_caches_late_data():
+    """Data after the deadline is kept for the next search, not drawn."""
+    cache: dict = {}
+    view = new_view(cache)
+    view.fill()
+    assert not view.arrived([("current", {"temp": 9})], True)
+    assert cache == {"current": {"temp": 9}}
+    assert ("current", {"temp": 9}) in new_view(cache).fill()
+
+
+def test_view_caches_arrived_data_but_not_failures():
+    """Failed sources leave the last data of the city in cache."""
+    cache = {"current": {"temp": 5}}
+    view = new_view(cache)
+    view.arrived([("current", None), ("hourly", [{"temp": 7}])], False)
+    assert cache == {"current": {"temp": 5}, "hourly": [{"temp": 7}]}
+    assert ("current", {"temp": 5}) in view.fill()
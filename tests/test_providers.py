@@ -0,0 +1,115 @@
+"""Tests of the One Call records against the forecast mode ones.
+
+The responses in fixtures are synthetic, not captured: they follow the
+documented schema of /weather, /forecast and One Call 3.0 for London,
+with values generated separately for each endpoint.
+"""
+import json
+from datetime import datetime
+from pathlib import Path
+
+import providers
+from forecast_stream import forecast_records
+
+FIXTURES = Path(__file__).parent / "fixtures"
+# DAY AFTER THE OBSERVATION OF THE FIXTURES, LIKE hourly_data ASKS FOR
+DATE = "2026-10-20"
+# MIDNIGHT OF THE OBSERVATION DAY, LIKE current_datetime
+TODAY = datetime(2026, 10, 19)
+
+
+def load(name: str) -> dict:
+    """Load a fixture response."""
+    with open(FIXTURES / f"{name}.json", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def forecast(make_response) -> list:
+    """Get the records of the fixture 5 day forecast."""
+    content = (FIXTURES / "forecast.json").read_bytes()
+    return forecast_records(make_response(content))
+
+
+def test_current_has_forecast_mode_shape():
+    """One Call current weather has the keys and types of /weather."""
+    expected = providers.weather_current(load("weather"))
+    current = providers.one_call_current(load("onecall"))
+    assert current.keys() == expected.keys()
+    for key, value in expected.items():
+        assert isinstance(current[key], type(value)), key
+
+
+def test_weather_current_maps_values():
+    """Current weather of /weather is read from main and wind."""
+    current = providers.weather_current(load("weather"))
+    assert current["temp"] == 11.61
+    assert current["temp_min"] == 10.31
+    assert current["temp_max"] == 12.51
+    assert current["wind"] == 6.52
+    assert current["icon"] == "10d"
+
+
+def test_one_call_current_maps_values():
+    """Low and high of today come from daily[0], wind from wind_speed."""
+    current = providers.one_call_current(load("onecall"))
+    assert current["temp"] == 11.57
+    assert current["temp_min"] == 10.6
+    assert current["temp_max"] == 15.23
+    assert current["wind"] == 3.32
+    assert current["visibility"] == 9000
+    assert current["icon"] == "03d"
+    assert current["description"] == "scattered clouds"
+
+
+def test_daily_has_forecast_mode_shape(make_response):
+    """One Call days have the keys and types of the forecast days."""
+    expected = providers.forecast_daily(forecast(make_response), TODAY)
+    daily = providers.one_call_daily(load("onecall"))
+    assert len(daily) == 5
+    for day in daily:
+        assert day.keys() == expected[0].keys()
+        for key, value in expected[0].items():
+            assert isinstance(day[key], type(value)), key
+
+
+def test_one_call_daily_maps_values():
+    """Days start tomorrow with the day temperature and main icon."""
+    daily = providers.one_call_daily(load("onecall"))
+    assert daily[0] == {
+        "date": "Tue 20",
+        "temp": 13.87,
+        "humidity": 77,
+        "icon": "02d",
+    }
+
+
+def test_hourly_has_forecast_mode_shape(make_response):
+    """One Call gives the same 3-hour slots of the date as the forecast."""
+    expected = providers.forecast_hourly(forecast(make_response), DATE)
+    hourly = providers.one_call_hourly(load("onecall"), DATE)
+    assert [slot["dt"] for slot in hourly] == [slot["dt"] for slot in expected]
+    for slot, expected_slot in zip(hourly, expected):
+        assert slot.keys() == expected_slot.keys()
+        assert slot["hour"] == expected_slot["hour"]
+
+
+def test_one_call_hourly_maps_values():
+    """Only every third hour of the date is kept, with its own values."""
+    hourly = providers.one_call_hourly(load("onecall"), DATE)
+    assert len(hourly) == 8
+    assert hourly[1:3] == [
+        {
+            "dt": 1792465200,
+            "hour": "3 AM",
+            "temp": 6.81,
+            "humidity": 84,
+            "icon": "04n",
+        },
+        {
+            "dt": 1792476000,
+            "hour": "6 AM",
+            "temp": 7.89,
+            "humidity": 86,
+            "icon": "04d",
+        },
+    ]
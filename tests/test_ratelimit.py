@@ -0,0 +1,125 @@
+"""Tests of the token bucket rate limits."""
+import sqlite3
+import threading
+import time
+
+import ratelimit
+
+
+def wait_for(condition, timeout: float = 5):
+    """Wait until condition() is true."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition never got true"
+        time.sleep(0.005)
+
+
+def len_waiting(limiter: ratelimit.RateLimiter) -> int:
+    """Get number of threads waiting for a token."""
+    return limiter.metrics()["waiting"]
+
+
+def test_buckets_refill_over_time():
+    """A used token comes back after period / count seconds."""
+    store = ratelimit.MemoryStore()
+    limits = [(2, 10)]
+    assert store.take("api", limits, 100.0) == 0
+    assert store.take("api", limits, 100.0) == 0
+    assert store.take("api", limits, 100.0) == 5.0
+    assert store.take("api", limits, 102.5) == 2.5
+    assert store.take("api", limits, 105.0) == 0
+    assert store.remaining("api", limits, 125.0) == [2.0]
+
+
+def test_every_limit_must_have_a_token():
+    """The longest wait of all limits is returned and nothing is taken."""
+    store = ratelimit.MemoryStore()
+    limits = [(5, 1), (1, 60)]
+    assert store.take("api", limits, 0.0) == 0
+    assert store.take("api", limits, 0.0) == 60.0
+    assert store.remaining("api", limits, 0.0) == [4.0, 0.0]
+
+
+def test_acquire_times_out():
+    """Without a token before the timeout acquire gives False."""
+    limiter = ratelimit.RateLimiter("api", [(1, 60)])
+    assert limiter.acquire(timeout=1)
+    started = time.monotonic()
+    assert not limiter.acquire(timeout=0.05)
+    assert time.monotonic() - started < 1
+    metrics = limiter.metrics()
+    assert metrics["granted"] == 1
+    assert metrics["timed_out"] == 1
+    assert metrics["waiting"] == 0
+    assert metrics["remaining"] == {"1/60s": 0}
+
+
+def test_interactive_goes_ahead_of_queued_background():
+    """An interactive request is served before older background ones."""
+    # EVERY REQUEST IS QUEUED LONG BEFORE THE NEXT TOKEN
+    limiter = ratelimit.RateLimiter("api", [(1, 0.5)])
+    assert limiter.acquire()
+    order: list = []
+
+    def request(name: str, priority: int):
+        limiter.acquire(priority, timeout=5)
+        order.append(name)
+
+    threads = []
+    for name, priority in (
+        ("background 1", ratelimit.BACKGROUND),
+        ("background 2", ratelimit.BACKGROUND),
+        ("interactive", ratelimit.INTERACTIVE),
+    ):
+        thread = threading.Thread(target=request, args=(name, priority))
+        threads.append(thread)
+        thread.start()
+        wait_for(lambda count=len(threads): len_waiting(limiter) == count)
+    for thread in threads:
+        thread.join()
+    assert order == ["interactive", "background 1", "background 2"]
+
+
+def test_sqlite_store_is_shared_between_limiters(tmp_path):
+    """Limiters of one file together stay within the limit."""
+    path = str(tmp_path / "limits.sqlite3")
+    limiters = [
+        ratelimit.RateLimiter("api", [(5, 3600)], ratelimit.SqliteStore(path))
+        for _ in range(2)
+    ]
+    granted: list = []
+
+    def request(limiter: ratelimit.RateLimiter):
+        granted.append(limiter.acquire(timeout=0.2))
+
+    threads = []
+    for limiter in limiters * 5:
+        threads.append(threading.Thread(target=request, args=(limiter,)))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert granted.count(True) == 5
+    assert sum(limiter.metrics()["granted"] for limiter in limiters) == 5
+    assert limiters[0].metrics()["remaining"] == {"5/3600s": 0}
+
+
+def test_locked_sqlite_store_keeps_the_timeout(tmp_path):
+    """A file locked by another process does not outlast the timeout."""
+    file_path = str(tmp_path / "limits.sqlite3")
+    limiter = ratelimit.RateLimiter(
+        "api",
+        [(5, 3600)],
+        ratelimit.SqliteStore(file_path),
+    )
+    other = sqlite3.connect(file_path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    try:
+        started = time.monotonic()
+        assert not limiter.acquire(timeout=0.2)
+        assert time.monotonic() - started < 2
+    finally:
+        other.execute("ROLLBACK")
+        other.close()
+    assert limiter.metrics()["timed_out"] == 1
+    assert limiter.acquire(timeout=1)
@@ -0,0 +1,73 @@
+"""Tests of the batch renderer."""
+from os import path
+
+import matplotlib
+from PIL import ImageFont
+
+import render
+
+CURRENT = {
+    "weather": "Clouds",
+    "icon": "04d",
+    "temp_max": 18.4,
+    "humidity": 71,
+}
+DAILY = [
+    {"date": "Tue 20", "temp": 16.2, "humidity": 60, "icon": "01d"},
+    {"date": "Wed 21", "temp": 14.8, "humidity": 82, "icon": "10d"},
+]
+
+
+def test_daily_card_has_panel_size():
+    """The card is as wide as the daily panel of the app."""
+    render._init_worker()  # pylint: disable=protected-access
+    card = render.daily_card(CURRENT, DAILY)
+    assert card.size == (240 + 130 * len(DAILY) - 10, 120)
+
+
+def test_missing_font_falls_back_to_default(monkeypatch):
+    """Without the TrueType file the default font is used."""
+    render._init_worker()  # pylint: disable=protected-access
+    monkeypatch.setitem(render.FONT_FILES, "Roboto Bold", "missing.ttf")
+    font = render._font("Roboto Bold", 9)  # pylint: disable=protected-access
+    assert isinstance(font, type(ImageFont.load_default()))
+
+
+def test_init_worker_clears_font_cache(monkeypatch):
+    """A font loaded by an earlier job does not hide a missing file."""
+    installed = path.join(matplotlib.get_data_path(), "fonts", "ttf")
+    monkeypatch.setitem(
+        render.FONT_FILES,
+        "Roboto Bold",
+        path.join(installed, "DejaVuSans-Bold.ttf"),
+    )
+    render._init_worker()  # pylint: disable=protected-access
+    font = render._font("Roboto Bold", 9)  # pylint: disable=protected-access
+    assert isinstance(font, ImageFont.FreeTypeFont)
+    monkeypatch.setitem(render.FONT_FILES, "Roboto Bold", "missing.ttf")
+    render._init_worker()  # pylint: disable=protected-access
+    font = render._font("Roboto Bold", 9)  # pylint: disable=protected-access
+    assert not isinstance(font, ImageFont.FreeTypeFont)
+
+
+def test_render_batch_writes_images(tmp_path):
+    """Every job gets a chart and a daily panel image."""
+    hourly = [
+        {"dt": 1792400400 + num * 10800, "hour": f"{num * 3} AM", "temp": num}
+        for num in range(4)
+    ]
+    results = render.render_batch(
+        [
+            {
+                "city": "Paris",
+                "current": CURRENT,
+                "daily": DAILY,
+                "hourly": hourly,
+            },
+        ],
+        str(tmp_path),
+        max_workers=1,
+    )
+    assert [result["city"] for result in results] == ["Paris"]
+    for key in ("chart", "daily"):
+        assert (tmp_path / f"Paris_{key}.png").exists()